@@ -22,6 +22,8 @@ class TeleFrameConfig:
         self.bot_token = kwargs.get("bot_token", "bot-disabled")
         self.whitelist_chats = kwargs.get("whitelist_chats", [])
         self.whitelist_admins = kwargs.get("whitelist_admins", [])
+        # Seconds Telegram holds each getUpdates request open (long polling)
+        self.bot_polling_timeout = kwargs.get("bot_polling_timeout", 20)
         
         # Bot Rate Limiting Configuration
         rate_limiting_config = kwargs.get("bot_rate_limiting", {})
@@ -37,6 +39,7 @@ class TeleFrameConfig:
         self.image_count = kwargs.get("image_count", 30)
         self.auto_delete_images = kwargs.get("auto_delete_images", True)
         self.show_videos = kwargs.get("show_videos", True)
+        self.validate_metadata_on_save = kwargs.get("validate_metadata_on_save", False)
         
         # Display Settings
         self.fullscreen = kwargs.get("fullscreen", True)
@@ -657,6 +660,8 @@ class TeleFrameConfig:
             raise ValueError("interval must be between 1000 and 300000 ms")
         if not 10 <= self.target_fps <= 120:
             raise ValueError("target_fps must be between 10 and 120")
+        if not 0 <= self.bot_polling_timeout <= 50:
+            raise ValueError("bot_polling_timeout must be between 0 and 50 seconds")
         
         valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
         if self.log_level.upper() not in valid_levels:
@@ -777,10 +782,12 @@ class TeleFrameConfig:
             'bot_token': self.bot_token,
             'whitelist_chats': self.whitelist_chats,
             'whitelist_admins': self.whitelist_admins,
+            'bot_polling_timeout': self.bot_polling_timeout,
             'image_folder': str(self.image_folder),
             'image_count': self.image_count,
             'auto_delete_images': self.auto_delete_images,
             'show_videos': self.show_videos,
+            'validate_metadata_on_save': self.validate_metadata_on_save,
             'fullscreen': self.fullscreen,
             'fade_time': self.fade_time,
             'interval': self.interval,
@@ -3,20 +3,84 @@
 Secure image management with validation and metadata handling
 """
 
+import os
+import re
+import asyncio
 import json
 import logging
 import magic
 import hashlib
 import tempfile
 import shutil
+import threading
+import time
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from functools import lru_cache
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from PIL import Image, ImageOps
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Bytes read from each end of a file for the duplicate fingerprint
+FINGERPRINT_CHUNK_SIZE = 64 * 1024
+
+# Read size for full file hashing
+HASH_CHUNK_SIZE = 1 << 20
+
+# Header bytes handed to libmagic for MIME detection
+MIME_SNIFF_SIZE = 2048
+
+# Quiet period after the last metadata change before it is written
+SAVE_DEBOUNCE_SECONDS = 0.5
+# Upper bound on how long a continuous stream of changes can delay a write
+SAVE_MAX_DELAY_SECONDS = 5.0
+# Pause before the flush thread retries a failed write
+SAVE_RETRY_SECONDS = 30.0
+
+# Whitespace and commas between entries of a JSON array
+_JSON_SEPARATOR_RE = re.compile(r'[\s,]*')
+
+# fdatasync skips the inode metadata flush; not available on every platform
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _pread_into(fd: int, view: memoryview, offset: int) -> int:
+    """Read into an existing buffer at an offset, returns bytes read"""
+    if hasattr(os, "preadv"):
+        return os.preadv(fd, [view], offset)
+    data = os.pread(fd, len(view), offset)
+    view[:len(data)] = data
+    return len(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode metadata as compact JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Decode metadata JSON, using orjson when installed"""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@dataclass(slots=True)
 class ImageInfo:
     """Image metadata structure"""
     src: str
@@ -30,27 +94,88 @@ class ImageInfo:
     unseen: bool = True
     file_hash: Optional[str] = None
     file_size: int = 0
+    fingerprint: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        return data
+        # Built by hand: asdict() deep-copies every field, which is wasted
+        # work for this flat record of primitives
+        return {
+            'src': self.src,
+            'sender': self.sender,
+            'caption': self.caption,
+            'chat_id': self.chat_id,
+            'chat_name': self.chat_name,
+            'message_id': self.message_id,
+            # Epoch seconds: cheaper to write and parse than an ISO string
+            'timestamp': self.timestamp.timestamp(),
+            'starred': self.starred,
+            'unseen': self.unseen,
+            'file_hash': self.file_hash,
+            'file_size': self.file_size,
+            'fingerprint': self.fingerprint,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ImageInfo':
         """Create from dictionary"""
-        data['timestamp'] = datetime.fromisoformat(data['timestamp'])
+        timestamp = data['timestamp']
+        if isinstance(timestamp, str):
+            # Metadata written before timestamps were stored as epoch seconds
+            data['timestamp'] = datetime.fromisoformat(timestamp)
+        else:
+            data['timestamp'] = datetime.fromtimestamp(timestamp)
         return cls(**data)
 
 
+if msgspec is not None:
+    # msgspec decodes JSON straight into ImageInfo dataclasses in C, skipping
+    # the per-entry from_dict round-trip. Non-strict mode lets it read epoch
+    # second timestamps as well as legacy ISO strings.
+    _IMAGES_ENCODER = msgspec.json.Encoder()
+    _IMAGES_DECODER = msgspec.json.Decoder(List[ImageInfo], strict=False)
+
+
+def _encode_images(images: List[ImageInfo]) -> bytes:
+    """Serialize image metadata to JSON bytes"""
+    data = [img.to_dict() for img in images]
+    if msgspec is not None:
+        return _IMAGES_ENCODER.encode(data)
+    return _json_dumps(data)
+
+
+def _decode_images(raw: bytes) -> Optional[List[ImageInfo]]:
+    """Decode and schema-check metadata in one pass, None if not possible"""
+    if msgspec is None:
+        return None
+    try:
+        images = _IMAGES_DECODER.decode(raw)
+    except msgspec.MsgspecError:
+        return None
+    for img in images:
+        # Epoch seconds decode as aware UTC; keep local naive like datetime.now()
+        if img.timestamp.tzinfo is not None:
+            img.timestamp = img.timestamp.astimezone().replace(tzinfo=None)
+    return images
+
+
 class ImageManager:
     """Manages image storage, metadata, and validation"""
 
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger(__name__)
+        # Stored oldest first so adding is an append; public indices count
+        # from the newest image (index 0), see _position()
         self.images: List[ImageInfo] = []
+        self._unseen_count = 0
+        # fingerprint -> ImageInfo for constant-time duplicate checks
+        self._fingerprint_index: Dict[str, ImageInfo] = {}
+        # (path, mtime, size) -> content validation result
+        self._content_check_cache = lru_cache(maxsize=128)(self._check_file_content_uncached)
+        # Worker threads for file validation in add_image_async
+        self._executor = ThreadPoolExecutor(max_workers=os.cpu_count(),
+                                            thread_name_prefix="ImageManager")
 
         # Ensure directories exist
         self.image_folder = Path(config.image_folder)
@@ -58,25 +183,40 @@ class ImageManager:
 
         self.metadata_file = self.image_folder / "images.json"
 
+        # Metadata writes are debounced onto a background thread
+        self._save_lock = threading.RLock()
+        self._dirty = threading.Event()
+        self._last_change = 0.0
+
         # Load existing images
         self._load_metadata()
+        self._backfill_fingerprints()
+
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="ImageManagerFlush", daemon=True
+        )
+        self._flush_thread.start()
+        atexit.register(self.flush)
 
         self.logger.info(f"ImageManager initialized with {len(self.images)} images")
 
     def _load_metadata(self):
         """Load metadata with corruption recovery"""
-        if not self.metadata_file.exists():
-            self.logger.info("No existing metadata file found")
-            return
+        backup_file = self.metadata_file.with_suffix('.backup')
 
-        # Try to load main file
-        if self._try_load_json_file(self.metadata_file):
+        if self.metadata_file.exists():
+            # Try to load main file
+            if self._try_load_json_file(self.metadata_file):
+                return
+            self.logger.warning("Main metadata file corrupt, trying backup...")
+        elif backup_file.exists():
+            # A save was interrupted between rotating the backup and the rename
+            self.logger.warning("Main metadata file missing, trying backup...")
+        else:
+            self.logger.info("No existing metadata file found")
             return
 
-        self.logger.warning("Main metadata file corrupt, trying backup...")
-
         # Try backup file
-        backup_file = self.metadata_file.with_suffix('.backup')
         if backup_file.exists() and self._try_load_json_file(backup_file):
             # Restore from backup
             try:
@@ -94,40 +234,129 @@ class ImageManager:
 
         # Last resort: start fresh
         self.logger.error("Could not recover metadata, starting with empty library")
-        self.images = []
+        self._set_images([])
         try:
             self._save_metadata()
         except Exception as e:
             self.logger.error(f"Could not create new metadata file: {e}")
 
 
+    def _set_images(self, images: List[ImageInfo]):
+        """Replace the image list and rebuild derived counters"""
+        self.images = images
+        self._unseen_count = sum(1 for img in images if img.unseen)
+        self._fingerprint_index = {img.fingerprint: img for img in images if img.fingerprint}
+
+    def _position(self, index: int) -> Optional[int]:
+        """Map a public index (0 = newest) to a position in self.images"""
+        if 0 <= index < len(self.images):
+            return len(self.images) - 1 - index
+        return None
+
+    def _unindex_image(self, image_info: ImageInfo):
+        """Drop an image from the fingerprint index"""
+        if self._fingerprint_index.get(image_info.fingerprint) is image_info:
+            del self._fingerprint_index[image_info.fingerprint]
+
+    def _backfill_fingerprints(self):
+        """Fingerprint images stored before fingerprints were recorded"""
+        backfilled = 0
+        for image_info in self.images:
+            if image_info.fingerprint:
+                continue
+            try:
+                image_info.fingerprint = self._calculate_fingerprint(Path(image_info.src))
+            except OSError as e:
+                self.logger.warning(f"Could not fingerprint {image_info.src}: {e}")
+                continue
+            self._fingerprint_index.setdefault(image_info.fingerprint, image_info)
+            backfilled += 1
+
+        if backfilled:
+            self.logger.info(f"Added fingerprints to {backfilled} stored images")
+            self._schedule_save()
+
+    def _schedule_save(self):
+        """Mark metadata dirty; the flush thread writes it shortly after"""
+        self._last_change = time.monotonic()
+        self._dirty.set()
+
+    def _flush_loop(self):
+        """Background loop writing pending metadata changes"""
+        while True:
+            self._dirty.wait()
+            # Restart the quiet period on every change, but never hold a
+            # write back longer than SAVE_MAX_DELAY_SECONDS
+            deadline = time.monotonic() + SAVE_MAX_DELAY_SECONDS
+            while True:
+                now = time.monotonic()
+                wait = min(self._last_change + SAVE_DEBOUNCE_SECONDS, deadline) - now
+                if wait <= 0:
+                    break
+                time.sleep(wait)
+            if not self.flush():
+                time.sleep(SAVE_RETRY_SECONDS)
+
+    def flush(self) -> bool:
+        """Write metadata now if there are unsaved changes
+
+        Returns False if the write failed; the changes stay marked dirty so
+        the flush thread and the atexit flush try again.
+        """
+        with self._save_lock:
+            if not self._dirty.is_set():
+                return True
+            self._dirty.clear()
+            try:
+                self._save_metadata()
+            except Exception:
+                # Already logged by _save_metadata
+                self._dirty.set()
+                return False
+            return True
+
     def _save_metadata(self):
         """Atomic save with backup and validation"""
+        with self._save_lock:
+            self._write_metadata()
+
+    def _write_metadata(self):
+        """Write metadata file (caller holds the save lock)"""
         try:
-            data = [img.to_dict() for img in self.images]
+            # Snapshot the list, it may be mutated while we serialize.
+            # The file keeps the newest image first.
+            payload = _encode_images(self.images[::-1])
         
             # Create temporary file in same directory (atomic move)
             temp_file = self.metadata_file.with_suffix('.tmp')
             backup_file = self.metadata_file.with_suffix('.backup')
         
             # Write to temporary file first
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(temp_file, 'wb') as f:
+                f.write(payload)
+                # Data must hit the disk before the rename, otherwise a power
+                # loss can leave an empty file behind the new name
+                f.flush()
+                _fdatasync(f.fileno())
         
-            # Validate the written file
-            if not self._validate_json_file(temp_file):
+            # The encoder output is valid JSON by construction; re-reading
+            # it is only done when explicitly requested
+            if (getattr(self.config, 'validate_metadata_on_save', False)
+                    and not self._validate_json_file(temp_file)):
                 raise ValueError("JSON validation failed after write")
         
-            # Create backup of current file (if exists)
-            if self.metadata_file.exists():
-                try:
-                    shutil.copy2(self.metadata_file, backup_file)
-                    self.logger.debug("Created backup of existing metadata")
-                except Exception as e:
-                    self.logger.warning(f"Could not create backup: {e}")
+            # Rotate the current file to the backup name; a rename only
+            # touches the directory entry instead of copying the file
+            try:
+                os.replace(self.metadata_file, backup_file)
+                self.logger.debug("Created backup of existing metadata")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning(f"Could not create backup: {e}")
         
-            # Atomic move (should be atomic on most filesystems)
-            shutil.move(str(temp_file), str(self.metadata_file))
+            # Atomic rename within the same directory
+            os.replace(temp_file, self.metadata_file)
         
             self.logger.debug("Metadata saved successfully with atomic write")
         
@@ -142,25 +371,48 @@ class ImageManager:
 
     def validate_file(self, file_path: Path) -> bool:
         """Validate file type and size"""
+        file_stat = self._check_file_basics(file_path)
+        return file_stat is not None and self._check_file_content(file_path, file_stat)
+
+    def _check_file_basics(self, file_path: Path) -> Optional[os.stat_result]:
+        """Cheap checks: existence, size and extension; returns the stat result"""
         try:
-            # Check file exists
-            if not file_path.exists():
+            # Check file exists (single stat, reused by later checks)
+            try:
+                file_stat = file_path.stat()
+            except FileNotFoundError:
                 self.logger.warning(f"File does not exist: {file_path}")
-                return False
+                return None
 
             # Check file size
-            file_size = file_path.stat().st_size
+            file_size = file_stat.st_size
             if file_size > self.config.max_file_size:
                 self.logger.warning(f"File too large: {file_size} bytes")
-                return False
+                return None
 
             # Check file extension
             if not self.config.is_file_allowed(file_path.name):
                 self.logger.warning(f"File type not allowed: {file_path.suffix}")
-                return False
+                return None
 
-            # Check MIME type using python-magic
-            mime_type = magic.from_file(str(file_path), mime=True)
+            return file_stat
+
+        except Exception as e:
+            self.logger.error(f"Error validating file {file_path}: {e}")
+            return None
+
+    def _check_file_content(self, file_path: Path, file_stat: os.stat_result) -> bool:
+        """Expensive checks, memoized while the file is unchanged"""
+        return self._content_check_cache(str(file_path), file_stat.st_mtime_ns, file_stat.st_size)
+
+    def _check_file_content_uncached(self, path: str, mtime_ns: int, size: int) -> bool:
+        """Expensive checks: MIME sniffing and image header parsing"""
+        file_path = Path(path)
+        try:
+            # Check MIME type using python-magic on the file header only
+            with open(file_path, 'rb') as f:
+                header = f.read(MIME_SNIFF_SIZE)
+            mime_type = magic.from_buffer(header, mime=True)
             allowed_mimes = {
                 '.jpg': 'image/jpeg',
                 '.jpeg': 'image/jpeg',
@@ -174,11 +426,11 @@ class ImageManager:
                 self.logger.warning(f"MIME type mismatch: {mime_type}")
                 return False
 
-            # For images, try to open with PIL
+            # For images, try to open with PIL (header parse, no full decode)
             if file_path.suffix.lower() in ['.jpg', '.jpeg', '.png', '.gif']:
                 try:
                     with Image.open(file_path) as img:
-                        img.verify()
+                        img.draft(img.mode, img.size)
                 except Exception as e:
                     self.logger.warning(f"Invalid image file: {e}")
                     return False
@@ -191,83 +443,164 @@ class ImageManager:
 
     def _calculate_file_hash(self, file_path: Path) -> str:
         """Calculate SHA256 hash of file"""
-        hash_sha256 = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: read/update loop runs in C without the GIL
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            # Large reads into a reused buffer let hashlib release the GIL
+            # and avoid allocating a bytes object per chunk
+            hash_sha256 = hashlib.sha256()
+            buffer = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while (read := f.readinto(buffer)):
+                hash_sha256.update(view[:read])
+            return hash_sha256.hexdigest()
+
+    def _calculate_fingerprint(self, file_path: Path) -> str:
+        """Calculate a quick duplicate fingerprint from size, head and tail"""
+        # Head and tail are read back to back into one buffer, no per-read
+        # bytes objects and a single hash update
+        buffer = bytearray(2 * FINGERPRINT_CHUNK_SIZE)
+        view = memoryview(buffer)
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            head = _pread_into(fd, view[:FINGERPRINT_CHUNK_SIZE], 0)
+            tail_offset = max(size - FINGERPRINT_CHUNK_SIZE, head)
+            tail = _pread_into(fd, view[head:head + FINGERPRINT_CHUNK_SIZE], tail_offset)
+        finally:
+            os.close(fd)
+
+        digest = hashlib.blake2b(size.to_bytes(8, "little"), digest_size=16)
+        digest.update(view[:head + tail])
+        return digest.hexdigest()
 
     def add_image(self, file_path: Path, sender: str, caption: str,
                   chat_id: int, chat_name: str, message_id: int) -> bool:
         """Add new image to collection"""
         try:
-            # Validate file
-            if not self.validate_file(file_path):
+            prepared = self._prepare_image(file_path)
+            if prepared is None:
                 return False
+            file_stat, fingerprint = prepared
+            return self._store_image(file_path, file_stat, fingerprint, sender,
+                                     caption, chat_id, chat_name, message_id)
 
-            # Calculate file hash to detect duplicates
-            file_hash = self._calculate_file_hash(file_path)
-
-            # Check for duplicates
-            for existing in self.images:
-                if existing.file_hash == file_hash:
-                    self.logger.info(f"Duplicate image detected: {file_path}")
-                    return False
+        except Exception as e:
+            self.logger.error(f"Error adding image: {e}")
+            return False
 
-            # Create image info
-            image_info = ImageInfo(
-                src=str(file_path),
-                sender=sender,
-                caption=caption or "",
-                chat_id=chat_id,
-                chat_name=chat_name,
-                message_id=message_id,
-                timestamp=datetime.now(),
-                file_hash=file_hash,
-                file_size=file_path.stat().st_size
-            )
-
-            # Add to beginning of list (newest first)
-            self.images.insert(0, image_info)
-
-            # Cleanup old images if necessary
-            self._cleanup_old_images()
-
-            # Save metadata
-            self._save_metadata()
+    async def add_image_async(self, file_path: Path, sender: str, caption: str,
+                              chat_id: int, chat_name: str, message_id: int) -> bool:
+        """Add new image to collection without blocking the event loop
 
-            self.logger.info(f"Added image: {file_path} from {sender}")
-            return True
+        File checks run on a worker thread; the image list is only updated
+        back on the calling (event loop) thread.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            prepared = await loop.run_in_executor(self._executor, self._prepare_image, file_path)
+            if prepared is None:
+                return False
+            file_stat, fingerprint = prepared
+            return self._store_image(file_path, file_stat, fingerprint, sender,
+                                     caption, chat_id, chat_name, message_id)
 
         except Exception as e:
             self.logger.error(f"Error adding image: {e}")
             return False
 
+    def _prepare_image(self, file_path: Path) -> Optional[Tuple[os.stat_result, str]]:
+        """File I/O part of adding an image, safe to run on a worker thread"""
+        file_stat = self._check_file_basics(file_path)
+        if file_stat is None:
+            return None
+
+        # Fingerprint reads at most 128 KB, so duplicates are rejected
+        # before paying for content validation or a full-file hash
+        fingerprint = self._calculate_fingerprint(file_path)
+        if fingerprint in self._fingerprint_index:
+            self.logger.info(f"Duplicate image detected: {file_path}")
+            return None
+
+        # Validate file
+        if not self._check_file_content(file_path, file_stat):
+            return None
+
+        return file_stat, fingerprint
+
+    def _store_image(self, file_path: Path, file_stat: os.stat_result, fingerprint: str,
+                     sender: str, caption: str, chat_id: int, chat_name: str,
+                     message_id: int) -> bool:
+        """Record a validated image in the collection"""
+        # Another add of the same file may have finished while we validated
+        if fingerprint in self._fingerprint_index:
+            self.logger.info(f"Duplicate image detected: {file_path}")
+            return False
+
+        # Create image info
+        image_info = ImageInfo(
+            src=str(file_path),
+            sender=sender,
+            caption=caption or "",
+            chat_id=chat_id,
+            chat_name=chat_name,
+            message_id=message_id,
+            timestamp=datetime.now(),
+            file_size=file_stat.st_size,
+            fingerprint=fingerprint
+        )
+
+        # Newest image goes at the end of the list
+        self.images.append(image_info)
+        self._unseen_count += 1
+        self._fingerprint_index[fingerprint] = image_info
+
+        # Cleanup old images if necessary
+        self._cleanup_old_images()
+
+        # Save metadata
+        self._schedule_save()
+
+        self.logger.info(f"Added image: {file_path} from {sender}")
+        return True
+
     def _cleanup_old_images(self):
         """Remove old images beyond the configured limit"""
         if len(self.images) <= self.config.image_count:
             return
 
-        # Count non-starred images
-        non_starred = [img for img in self.images if not img.starred]
-        starred = [img for img in self.images if img.starred]
+        # Partition positions by star status in one pass
+        starred = []
+        non_starred = []
+        for i, img in enumerate(self.images):
+            (starred if img.starred else non_starred).append(i)
 
-        # Calculate how many to remove
         total_limit = self.config.image_count
         starred_count = len(starred)
 
         if starred_count >= total_limit:
             # Too many starred images, keep newest starred ones
-            to_keep = starred[:total_limit]
-            to_remove = starred[total_limit:] + non_starred
+            keep = set(starred[starred_count - total_limit:])
         else:
             # Keep all starred + newest non-starred
             non_starred_limit = total_limit - starred_count
-            to_keep = starred + non_starred[:non_starred_limit]
-            to_remove = non_starred[non_starred_limit:]
-
-        # Remove files and metadata
-        for image_info in to_remove:
+            keep = set(starred)
+            keep.update(non_starred[len(non_starred) - non_starred_limit:])
+
+        # Rebuild the list in its original order, dropping the rest
+        kept = []
+        removed = 0
+        for i, image_info in enumerate(self.images):
+            if i in keep:
+                kept.append(image_info)
+                continue
+
+            removed += 1
+            self._unindex_image(image_info)
+            if image_info.unseen:
+                self._unseen_count -= 1
             if self.config.auto_delete_images:
                 try:
                     Path(image_info.src).unlink(missing_ok=True)
@@ -275,23 +608,24 @@ class ImageManager:
                 except Exception as e:
                     self.logger.error(f"Error deleting file {image_info.src}: {e}")
 
-        # Update images list
-        self.images = to_keep
-        self.logger.info(f"Cleaned up {len(to_remove)} old images")
+        self.images = kept
+        self.logger.info(f"Cleaned up {removed} old images")
 
     def star_image(self, index: int) -> bool:
         """Toggle star status of image"""
-        if 0 <= index < len(self.images):
-            self.images[index].starred = not self.images[index].starred
-            self._save_metadata()
+        position = self._position(index)
+        if position is not None:
+            self.images[position].starred = not self.images[position].starred
+            self._schedule_save()
             self.logger.info(f"Toggled star for image {index}")
             return True
         return False
 
     def delete_image(self, index: int) -> bool:
         """Delete specific image"""
-        if 0 <= index < len(self.images):
-            image_info = self.images[index]
+        position = self._position(index)
+        if position is not None:
+            image_info = self.images[position]
 
             # Delete file
             try:
@@ -301,8 +635,11 @@ class ImageManager:
                 self.logger.error(f"Error deleting file: {e}")
 
             # Remove from list
-            del self.images[index]
-            self._save_metadata()
+            del self.images[position]
+            if image_info.unseen:
+                self._unseen_count -= 1
+            self._unindex_image(image_info)
+            self._schedule_save()
 
             self.logger.info(f"Deleted image at index {index}")
             return True
@@ -312,7 +649,8 @@ class ImageManager:
         """Mark all images as seen"""
         for image in self.images:
             image.unseen = False
-        self._save_metadata()
+        self._unseen_count = 0
+        self._schedule_save()
         self.logger.info("Marked all images as seen")
 
     def get_image_count(self) -> int:
@@ -321,12 +659,13 @@ class ImageManager:
 
     def get_unseen_count(self) -> int:
         """Get number of unseen images"""
-        return sum(1 for img in self.images if img.unseen)
+        return self._unseen_count
 
     def get_image_info(self, index: int) -> Optional[ImageInfo]:
         """Get image info by index"""
-        if 0 <= index < len(self.images):
-            return self.images[index]
+        position = self._position(index)
+        if position is not None:
+            return self.images[position]
         return None
 
     def get_image_path(self, index: int) -> Optional[Path]:
@@ -339,8 +678,8 @@ class ImageManager:
     def _validate_json_file(self, file_path: Path) -> bool:
         """Validate JSON file structure"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = _json_loads(f.read())
 
             # Check if it's a list
             if not isinstance(data, list):
@@ -372,27 +711,30 @@ class ImageManager:
     def _try_load_json_file(self, file_path: Path) -> bool:
         """Try to load a specific JSON file"""
         try:
-            # First validate the file
-            if not self._validate_json_file(file_path):
-                return False
+            # Fast path: typed decode straight into ImageInfo objects
+            parsed_images = _decode_images(file_path.read_bytes())
 
-            # Load the data
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if parsed_images is None:
+                # First validate the file
+                if not self._validate_json_file(file_path):
+                    return False
 
-            loaded_images = []
-            for item in data:
-                try:
-                    image_info = ImageInfo.from_dict(item)
-                    # Verify file still exists
-                    if Path(image_info.src).exists():
-                        loaded_images.append(image_info)
-                    else:
-                        self.logger.warning(f"Image file missing: {image_info.src}")
-                except Exception as e:
-                    self.logger.error(f"Error loading image metadata: {e}")
+                # Load the data, skipping entries that do not parse
+                with open(file_path, 'rb') as f:
+                    data = _json_loads(f.read())
+
+                parsed_images = []
+                for item in data:
+                    try:
+                        parsed_images.append(ImageInfo.from_dict(item))
+                    except Exception as e:
+                        self.logger.error(f"Error loading image metadata: {e}")
 
-            self.images = loaded_images
+            # File is newest first, memory is oldest first
+            parsed_images.reverse()
+
+            # Verify files still exist
+            self._set_images(self._filter_existing_images(parsed_images, log_missing=True))
             self.logger.info(f"Loaded {len(self.images)} valid images from {file_path.name}")
             return True
 
@@ -400,6 +742,45 @@ class ImageManager:
             self.logger.error(f"Error loading {file_path}: {e}")
             return False
 
+    def _filter_existing_images(self, images: List[ImageInfo],
+                                log_missing: bool = False) -> List[ImageInfo]:
+        """Drop entries whose files are gone"""
+        if not images:
+            return []
+
+        # One directory listing answers for every file in the image folder
+        folder = os.path.normpath(self.image_folder)
+        try:
+            with os.scandir(self.image_folder) as entries:
+                folder_names = {entry.name for entry in entries}
+        except OSError:
+            folder_names = None
+
+        exists: List[Optional[bool]] = []
+        outside_folder = []
+        for image_info in images:
+            if (folder_names is not None
+                    and os.path.normpath(os.path.dirname(image_info.src)) == folder):
+                exists.append(os.path.basename(image_info.src) in folder_names)
+            else:
+                exists.append(None)
+                outside_folder.append(len(exists) - 1)
+
+        if outside_folder:
+            # stat() calls are I/O bound, overlap them on slow SD/NFS storage
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = executor.map(lambda i: Path(images[i].src).exists(), outside_folder)
+                for i, file_exists in zip(outside_folder, results):
+                    exists[i] = file_exists
+
+        existing_images = []
+        for image_info, file_exists in zip(images, exists):
+            if file_exists:
+                existing_images.append(image_info)
+            elif log_missing:
+                self.logger.warning(f"Image file missing: {image_info.src}")
+        return existing_images
+
     def _recover_corrupt_json(self) -> bool:
         """Attempt to recover from corrupted JSON by truncating bad entries"""
         try:
@@ -408,50 +789,42 @@ class ImageManager:
             with open(self.metadata_file, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            # Try to find the last valid JSON structure
-            lines = content.split('\n')
+            # Decode the array entry by entry in a single forward pass and
+            # keep everything before the first entry that fails to parse
+            start = content.find('[')
+            if start == -1:
+                self.logger.error("Could not recover any valid entries from corrupted JSON")
+                return False
 
-            # Work backwards from the end
-            for i in range(len(lines) - 1, -1, -1):
+            decoder = json.JSONDecoder()
+            data = []
+            index = start + 1
+            while True:
+                index = _JSON_SEPARATOR_RE.match(content, index).end()
+                if index >= len(content) or content[index] == ']':
+                    break
                 try:
-                    # Try to parse from start to this line
-                    test_content = '\n'.join(lines[:i+1])
-
-                    # If content doesn't end with ], try to fix it
-                    if not test_content.strip().endswith(']'):
-                        # Find last complete entry (ending with })
-                        last_brace = test_content.rfind('}')
-                        if last_brace > 0:
-                            # Cut after last complete entry and add closing bracket
-                            test_content = test_content[:last_brace+1] + '\n]'
-                        else:
-                            continue
-
-                    # Try to parse the reconstructed JSON
-                    data = json.loads(test_content)
-
-                    if isinstance(data, list) and len(data) > 0:
-                        # Validate and load entries
-                        valid_entries = []
-                        for entry in data:
-                            try:
-                                image_info = ImageInfo.from_dict(entry)
-                                if Path(image_info.src).exists():
-                                    valid_entries.append(image_info)
-                            except Exception:
-                                continue
-
-                        if valid_entries:
-                            self.images = valid_entries
-                            # Save recovered data
-                            self._save_metadata()
-                            self.logger.info(f"Successfully recovered {len(valid_entries)} images from corrupted file")
-                            return True
-
+                    entry, index = decoder.raw_decode(content, index)
                 except json.JSONDecodeError:
-                    continue
+                    break
+                data.append(entry)
+
+            # Validate and load entries
+            parsed_entries = []
+            for entry in data:
+                try:
+                    parsed_entries.append(ImageInfo.from_dict(entry))
                 except Exception:
                     continue
+            parsed_entries.reverse()
+            valid_entries = self._filter_existing_images(parsed_entries)
+
+            if valid_entries:
+                self._set_images(valid_entries)
+                # Save recovered data
+                self._save_metadata()
+                self.logger.info(f"Successfully recovered {len(valid_entries)} images from corrupted file")
+                return True
 
             self.logger.error("Could not recover any valid entries from corrupted JSON")
             return False
@@ -460,8 +833,12 @@ class ImageManager:
             self.logger.error(f"Recovery attempt failed: {e}")
             return False
 
-    def verify_metadata_integrity(self) -> bool:
-        """Verify metadata file integrity (for debugging)"""
+    def verify_metadata_integrity(self, check_file_hashes: bool = False) -> bool:
+        """Verify metadata file integrity (for debugging)
+
+        With check_file_hashes, every image is also hashed with SHA256: missing
+        hashes are recorded and mismatches against stored hashes reported.
+        """
         if not self.metadata_file.exists():
             self.logger.info("No metadata file to verify")
             return True
@@ -472,19 +849,48 @@ class ImageManager:
                 self.logger.info("Metadata file integrity: OK")
             else:
                 self.logger.warning("Metadata file integrity: FAILED")
+
+            if check_file_hashes and not self._verify_file_hashes():
+                is_valid = False
             return is_valid
         except Exception as e:
             self.logger.error(f"Error verifying metadata integrity: {e}")
             return False
 
+    def _verify_file_hashes(self) -> bool:
+        """Compute full SHA256 hashes lazily and compare with stored ones"""
+        all_match = True
+        recorded = 0
+        for image_info in list(self.images):
+            try:
+                file_hash = self._calculate_file_hash(Path(image_info.src))
+            except OSError as e:
+                self.logger.warning(f"Could not hash {image_info.src}: {e}")
+                all_match = False
+                continue
+
+            if image_info.file_hash is None:
+                image_info.file_hash = file_hash
+                recorded += 1
+            elif image_info.file_hash != file_hash:
+                self.logger.warning(f"File content changed: {image_info.src}")
+                all_match = False
+
+        if recorded:
+            self.logger.info(f"Recorded SHA256 hashes for {recorded} images")
+            self._schedule_save()
+        return all_match
+
 
     def mark_image_seen(self, index: int) -> bool:
         """Mark specific image as seen"""
-        if 0 <= index < len(self.images):
-            if self.images[index].unseen:
-                self.images[index].unseen = False
-                self._save_metadata()  # Persistieren der Änderung
-                self.logger.debug(f"Marked image {index} as seen: {self.images[index].src}")
+        image_info = self.get_image_info(index)
+        if image_info is not None:
+            if image_info.unseen:
+                image_info.unseen = False
+                self._unseen_count -= 1
+                self._schedule_save()  # Persistieren der Änderung
+                self.logger.debug(f"Marked image {index} as seen: {image_info.src}")
                 return True
             else:
                 self.logger.debug(f"Image {index} was already seen")
@@ -499,15 +905,17 @@ class ImageManager:
         changes_made = False
         
         for index in indices:
-            if 0 <= index < len(self.images):
-                if self.images[index].unseen:
-                    self.images[index].unseen = False
+            image_info = self.get_image_info(index)
+            if image_info is not None:
+                if image_info.unseen:
+                    image_info.unseen = False
                     marked_count += 1
                     changes_made = True
-                    self.logger.debug(f"Marked image {index} as seen: {self.images[index].src}")
+                    self.logger.debug(f"Marked image {index} as seen: {image_info.src}")
         
         if changes_made:
-            self._save_metadata()  # Einmal speichern für alle Änderungen
+            self._unseen_count -= marked_count
+            self._schedule_save()  # Einmal speichern für alle Änderungen
             self.logger.info(f"Marked {marked_count} images as seen")
         
         return marked_count
@@ -515,7 +923,7 @@ class ImageManager:
     def get_unseen_images(self) -> List[int]:
         """Get list of indices of unseen images"""
         unseen_indices = []
-        for i, image in enumerate(self.images):
+        for i, image in enumerate(reversed(self.images)):
             if image.unseen:
                 unseen_indices.append(i)
         return unseen_indices
@@ -529,19 +937,15 @@ class ImageManager:
                 reset_count += 1
         
         if reset_count > 0:
-            self._save_metadata()
+            self._unseen_count = len(self.images)
+            self._schedule_save()
             self.logger.info(f"Reset {reset_count} images to unseen status")
         
         return reset_count
 
     def get_seen_count(self) -> int:
         """Get number of seen images"""
-        try:
-            seen_count = sum(1 for img in self.images if not img.unseen)
-            return seen_count
-        except Exception as e:
-            self.logger.error(f"Error counting seen images: {e}")
-            return 0
+        return len(self.images) - self._unseen_count
 
     def debug_unseen_status(self):
         """Debug method to show unseen status of all images"""
@@ -549,7 +953,7 @@ class ImageManager:
         total = len(self.images)
         unseen_count = 0
         
-        for i, image in enumerate(self.images):
+        for i, image in enumerate(reversed(self.images)):
             status = "UNSEEN" if image.unseen else "SEEN"
             self.logger.info(f"Image {i}: {status} - {Path(image.src).name}")
             if image.unseen:
@@ -562,8 +966,8 @@ class ImageManager:
     def get_image_stats(self) -> Dict[str, int]:
         """Get comprehensive image statistics"""
         total = len(self.images)
-        unseen = self.get_unseen_count()
-        seen = self.get_seen_count()
+        unseen = self._unseen_count
+        seen = total - unseen
         
         return {
             'total_images': total,
@@ -574,10 +978,16 @@ class ImageManager:
 
 if __name__ == "__main__":
     # Test image manager
+    import sys
     from config import TeleFrameConfig
 
     config = TeleFrameConfig()
     manager = ImageManager(config)
 
+    if "--pretty" in sys.argv:
+        # images.json is stored compact; print it indented for humans
+        print(json.dumps([img.to_dict() for img in reversed(manager.images)], indent=2, ensure_ascii=False))
+        sys.exit(0)
+
     print(f"Loaded {manager.get_image_count()} images")
     print(f"Unseen: {manager.get_unseen_count()}")
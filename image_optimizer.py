@@ -5,14 +5,112 @@ Advanced image optimization system for TeleFrame with configurable compression
 and automatic format conversion for optimal display performance.
 """
 
+import io
 import logging
+import multiprocessing
+import mmap
 import os
 import hashlib
-from datetime import datetime
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Tuple, Optional, Dict, Any
-from PIL import Image, ImageOps, ImageFilter
-from PIL.ExifTags import ORIENTATION
+from typing import Tuple, Optional, Dict, Any, Union, List
+import PIL
+from PIL import Image, ImageOps, ImageFilter, ExifTags, features
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    import pyvips
+except (ImportError, OSError):
+    # pyvips raises OSError when the libvips shared library is missing
+    pyvips = None
+
+try:
+    import oxipng
+except ImportError:
+    oxipng = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420, TJFLAG_PROGRESSIVE
+except ImportError:
+    TurboJPEG = None
+
+# File extension -> Pillow format name
+_EXT_TO_FMT = {
+    '.jpg': 'JPEG',
+    '.jpeg': 'JPEG',
+    '.png': 'PNG',
+    '.gif': 'GIF',
+    '.webp': 'WEBP',
+}
+
+# Last 12 bytes of every complete PNG (empty IEND chunk)
+_PNG_TRAILER = b'\x00\x00\x00\x00IEND\xaeB`\x82'
+
+# Output format -> extension of optimized files
+_FMT_TO_EXT = {
+    'JPEG': '.jpg',
+    'PNG': '.png',
+    'WEBP': '.webp',
+}
+
+# (highest compress_level, quality settings), checked in order
+# Higher compress_level = lower quality = smaller files
+_QUALITY_TABLE = (
+    (10, {'jpeg': 95, 'png': 1, 'webp': 95}),   # Minimal compression
+    (30, {'jpeg': 90, 'png': 3, 'webp': 90}),   # Light compression
+    (50, {'jpeg': 85, 'png': 5, 'webp': 85}),   # Medium compression
+    (70, {'jpeg': 75, 'png': 7, 'webp': 75}),   # High compression
+    (85, {'jpeg': 65, 'png': 8, 'webp': 65}),   # Very high compression
+)
+_MAX_COMPRESSION = {'jpeg': 55, 'png': 9, 'webp': 55}
+
+# Units for _format_bytes, one per factor of 1024
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Files batch_optimize reads ahead of the worker processes
+BATCH_READ_AHEAD = 4
+
+# Inputs already at display size and below this are returned untouched
+SKIP_REENCODE_MAX_BYTES = 200 * 1024
+
+# Sum of the IJG standard luminance quantization table (quality 50)
+_STD_LUMA_QUANT_SUM = 3688
+
+# Pillow mode -> oxipng.ColorType constructor for raw PNG encoding
+_OXIPNG_COLOR_TYPES = {
+    'RGB': 'rgb',
+    'RGBA': 'rgba',
+    'L': 'grayscale',
+    'LA': 'grayscale_alpha',
+}
+
+# Output formats written by the fused libvips pipeline; PNG stays with
+# Pillow so it can be encoded by oxipng
+_VIPS_FORMATS = ('JPEG', 'WEBP')
+
+# Pillow modes handled as uint8 arrays by the OpenCV pipeline; images with
+# alpha stay with Pillow, whose resize premultiplies it and so avoids dark
+# fringes along transparent edges
+_CV2_MODES = ('RGB', 'L')
+
+# Frames above this many pixels are sharpened on the GPU when CUDA is available
+GPU_SHARPEN_MIN_PIXELS = 1_000_000
 
 
 class ImageOptimizer:
@@ -31,6 +129,8 @@ class ImageOptimizer:
         self.auto_format_conversion = getattr(config, 'auto_format_conversion', True)
         self.preserve_aspect_ratio = getattr(config, 'preserve_aspect_ratio', True)
         self.enable_sharpening = getattr(config, 'enable_sharpening', False)
+        # Off in batch workers, each would create its own CUDA context
+        self.cuda_sharpening = getattr(config, 'cuda_sharpening', True)
         self.max_quality = getattr(config, 'max_quality', 95)
         self.min_quality = getattr(config, 'min_quality', 60)
         
@@ -45,31 +145,111 @@ class ImageOptimizer:
         # Quality mappings for different compression levels
         self.quality_map = self._create_quality_map()
         
+        # Huffman optimization and progressive scans dominate JPEG encode
+        # time; below medium compression speed is preferred over size
+        self._thorough_jpeg = self.compress_level >= 50
+        # Light compression writes PNG with zlib's fastest setting
+        self._fast_png = self.compress_level <= 30
+        
+        # Settings are fixed after init, so the save arguments are too
+        self._save_kwargs_by_fmt = self._create_save_kwargs()
+        self._vips_save_kwargs = {
+            'JPEG': {'Q': self.quality_map['jpeg'], 'optimize_coding': self._thorough_jpeg,
+                     'interlace': self._thorough_jpeg, 'strip': True},
+            'WEBP': {'Q': self.quality_map['webp'], 'effort': 6, 'strip': True},
+        }
+        
+        # libjpeg-turbo for JPEG to JPEG when libvips is not available
+        self._tj = None
+        if TurboJPEG is not None and np is not None:
+            try:
+                self._tj = TurboJPEG()
+            except Exception as e:
+                # Raised when the libturbojpeg shared library is missing
+                self.logger.debug(f"TurboJPEG unavailable: {e}")
+        
+        # OpenCV's vectorized, multi-threaded kernels for resize and sharpening
+        self._use_cv2 = cv2 is not None and np is not None
+        
+        # CUDA sharpening for large frames
+        self._torch = None
+        self._gaussian_kernel = None
+        if self.enable_sharpening and self.cuda_sharpening and np is not None:
+            self._init_cuda_sharpening()
+        
+        # libvips streams decode, shrink and encode; Pillow is the fallback
+        if pyvips is not None:
+            self._backend = 'vips'
+        elif self._tj is not None:
+            self._backend = 'turbojpeg'
+        else:
+            self._backend = 'pillow'
+        
         self.logger.info(f"🖼️  Image Optimizer initialized:")
         self.logger.info(f"   Optimization: {'Enabled' if self.optimization_enabled else 'Disabled'}")
+        self.logger.info(f"   Backend: {self._backend}")
         self.logger.info(f"   Target resolution: {self.target_width}x{self.target_height}")
         self.logger.info(f"   Compression level: {self.compress_level}")
         self.logger.info(f"   Quality range: {self.min_quality}-{self.max_quality}")
+        
+        self._check_pillow_build()
+    
+    def _check_pillow_build(self):
+        """Log whether Pillow was built with its SIMD kernels and libjpeg-turbo"""
+        # Pillow-SIMD releases carry a .postN suffix, e.g. 9.5.0.post1
+        simd = '.post' in PIL.__version__
+        turbo = features.check_feature('libjpeg_turbo')
+        self.logger.info(f"   Pillow: {PIL.__version__} (SIMD: {'yes' if simd else 'no'}, "
+                         f"libjpeg-turbo: {'yes' if turbo else 'no'})")
+        
+        # Only the Pillow backend runs resize, sharpening and encode in Pillow
+        if self._backend == 'pillow' and not simd:
+            self.logger.info(
+                'Pillow-SIMD speeds up resize and sharpening several times, install with: '
+                'pip uninstall -y pillow && CC="cc -mavx2" pip install --no-binary :all: pillow-simd'
+            )
+    
+    def _create_save_kwargs(self) -> Dict[str, Dict[str, Any]]:
+        """Create Pillow save arguments for every output format"""
+        return {
+            'JPEG': {
+                'format': 'JPEG',
+                'quality': self.quality_map['jpeg'],
+                'optimize': self._thorough_jpeg,
+                'progressive': self._thorough_jpeg,  # Progressive JPEG for better perceived loading
+            },
+            'PNG': {
+                'format': 'PNG',
+                'optimize': not self._fast_png,
+                # 0-9, higher = more compression
+                'compress_level': 1 if self._fast_png else self.quality_map['png'],
+            },
+            'WEBP': {
+                'format': 'WEBP',
+                'quality': self.quality_map['webp'],
+                'optimize': True,
+                'method': 6,  # Best compression method
+            },
+            'GIF': {
+                'format': 'GIF',
+                'optimize': True,
+                'save_all': True,  # For animated GIFs
+            },
+        }
     
     def _create_quality_map(self) -> Dict[str, int]:
         """Create quality mapping based on compression level (0-100)"""
-        # Map compression level to JPEG quality
-        # Higher compress_level = lower quality = smaller files
-        if self.compress_level <= 10:
-            return {'jpeg': 95, 'png': 1, 'webp': 95}  # Minimal compression
-        elif self.compress_level <= 30:
-            return {'jpeg': 90, 'png': 3, 'webp': 90}  # Light compression
-        elif self.compress_level <= 50:
-            return {'jpeg': 85, 'png': 5, 'webp': 85}  # Medium compression
-        elif self.compress_level <= 70:
-            return {'jpeg': 75, 'png': 7, 'webp': 75}  # High compression
-        elif self.compress_level <= 85:
-            return {'jpeg': 65, 'png': 8, 'webp': 65}  # Very high compression
-        else:
-            return {'jpeg': 55, 'png': 9, 'webp': 55}  # Maximum compression
+        quality = next((mapping for threshold, mapping in _QUALITY_TABLE
+                        if self.compress_level <= threshold), _MAX_COMPRESSION)
+        # Copy, callers get this dict through get_optimization_stats()
+        return dict(quality)
     
-    def optimize_image(self, input_path: Path, output_path: Optional[Path] = None) -> Optional[Path]:
-        """Optimize image for display with configurable compression"""
+    def optimize_image(self, input_path: Path, output_path: Optional[Path] = None,
+                       data: Optional[bytes] = None) -> Optional[Path]:
+        """Optimize image for display with configurable compression
+        
+        data is the content of input_path if the caller already read it.
+        """
         
         if not self.optimization_enabled:
             self.logger.debug("Image optimization disabled, skipping")
@@ -80,16 +260,27 @@ class ImageOptimizer:
             return None
         
         try:
-            # Generate output path if not provided
-            if output_path is None:
-                output_path = self._generate_optimized_path(input_path)
-            
-            # Load and process image
-            optimized_path = self._process_image(input_path, output_path)
+            # Opened once (headers only) and shared by every step below
+            with Image.open(io.BytesIO(data) if data is not None else input_path) as img:
+                if self._is_already_optimized(input_path, img):
+                    self.logger.debug(f"Image already optimized, keeping original: {input_path}")
+                    return input_path
+                
+                # Generate output path if not provided
+                if output_path is None:
+                    output_path = self._generate_optimized_path(input_path, img, data)
+                    if self._is_complete_output(output_path):
+                        # Same content and settings were optimized before
+                        self.logger.debug(f"Reusing optimized image: {output_path}")
+                        return output_path
+                
+                # Load and process image
+                result = self._process_image(input_path, output_path, img, data)
             
-            if optimized_path:
+            if result:
                 # Log optimization results
-                self._log_optimization_results(input_path, optimized_path)
+                optimized_path, dimensions = result
+                self._log_optimization_results(input_path, optimized_path, dimensions)
                 return optimized_path
             else:
                 self.logger.warning(f"Optimization failed, keeping original: {input_path}")
@@ -99,104 +290,348 @@ class ImageOptimizer:
             self.logger.error(f"Error optimizing image {input_path}: {e}")
             return input_path
     
-    def _generate_optimized_path(self, input_path: Path) -> Path:
-        """Generate optimized file path with appropriate extension"""
+    def _is_already_optimized(self, input_path: Path, img: Image.Image) -> bool:
+        """Check from headers only whether re-encoding could not pay off"""
+        if self.auto_format_conversion:
+            return False
+        if self._get_format_from_path(input_path) not in ('JPEG', 'WEBP'):
+            return False
+        
+        try:
+            # img is not loaded yet, only its headers have been parsed
+            if (img.size[0] > self.target_width or img.size[1] > self.target_height or
+                    img.getexif().get(ExifTags.Base.Orientation, 1) != 1):
+                return False
+            
+            if input_path.stat().st_size < SKIP_REENCODE_MAX_BYTES:
+                return True
+            
+            # Minimal compression would re-encode a high quality JPEG at
+            # about the same quality and a larger size
+            if self.compress_level <= 10 and img.format == 'JPEG':
+                return self._estimate_jpeg_quality(img) >= 85
+            
+        except Exception as e:
+            self.logger.debug(f"Could not probe {input_path}: {e}")
+        
+        return False
+    
+    def _estimate_jpeg_quality(self, img: Image.Image) -> float:
+        """Estimate IJG quality (1-100) from the luminance quantization table"""
+        tables = getattr(img, 'quantization', None)
+        if not tables or 0 not in tables:
+            return 0.0
+        
+        # Invert the IJG quality scaling applied to the standard table
+        scale = sum(tables[0]) * 100 / _STD_LUMA_QUANT_SUM
+        if scale <= 100:
+            return (200 - scale) / 2
+        return 5000 / scale
+    
+    def _generate_optimized_path(self, input_path: Path, img: Optional[Image.Image] = None,
+                                 data: Optional[bytes] = None) -> Path:
+        """Generate content-addressed optimized file path with appropriate extension"""
         
         # Determine best format for this image
-        optimal_format = self._determine_optimal_format(input_path)
-        
-        # Create new filename with optimization suffix and proper extension
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        base_name = input_path.stem
-        
-        if optimal_format.lower() == 'jpeg':
-            extension = '.jpg'
-        elif optimal_format.lower() == 'png':
-            extension = '.png'
-        elif optimal_format.lower() == 'webp':
-            extension = '.webp'
-        else:
-            extension = '.jpg'  # Fallback
+        optimal_format = self._determine_optimal_format(img if img is not None else input_path)
+        extension = _FMT_TO_EXT.get(optimal_format, '.jpg')
         
-        # Generate unique filename
-        optimized_name = f"{timestamp}_{base_name}_opt{extension}"
+        # Identical input + settings always map to the same file name
+        optimized_name = f"{self._content_key(input_path, data)}_opt{extension}"
         return input_path.parent / optimized_name
     
-    def _determine_optimal_format(self, image_path: Path) -> str:
-        """Determine optimal format based on image characteristics"""
+    def _is_complete_output(self, path: Path) -> bool:
+        """Check an existing optimized file's header and trailer before reusing it
+        
+        Files are written atomically, but one truncated by an older version
+        or by a full disk would otherwise be reused for every upload of the
+        same image, so it is removed here and encoded again.
+        """
+        try:
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                head = f.read(12)
+                f.seek(max(size - 12, 0))
+                tail = f.read(12)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            self.logger.debug(f"Could not check optimized image {path}: {e}")
+            return False
+        
+        output_format = self._get_format_from_path(path)
+        if output_format == 'PNG':
+            complete = head.startswith(b'\x89PNG\r\n\x1a\n') and tail == _PNG_TRAILER
+        elif output_format == 'WEBP':
+            complete = (head[:4] == b'RIFF' and head[8:12] == b'WEBP' and
+                        int.from_bytes(head[4:8], 'little') + 8 == size)
+        else:
+            complete = head.startswith(b'\xff\xd8') and tail.endswith(b'\xff\xd9')
+        
+        if not complete:
+            self.logger.warning(f"Discarding incomplete optimized image: {path}")
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        return complete
+    
+    def _content_key(self, input_path: Path, data: Optional[bytes] = None) -> str:
+        """Hash source bytes and output settings (BLAKE3, blake2b fallback)"""
+        hasher = blake3.blake3() if blake3 is not None else hashlib.blake2b(digest_size=16)
+        
+        if data is not None:
+            hasher.update(data)
+        else:
+            with open(input_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        hasher.update(mapped)
+        
+        settings = (self.quality_map, self.target_width, self.target_height,
+                    self.compress_level, self.enable_sharpening, self.preserve_aspect_ratio,
+                    self.auto_format_conversion)
+        hasher.update(repr(settings).encode())
+        
+        if blake3 is not None:
+            return hasher.hexdigest(16)
+        return hasher.hexdigest()
+    
+    def _determine_optimal_format(self, image: Union[Path, Image.Image]) -> str:
+        """Determine optimal format based on image characteristics
+        
+        Accepts a path or an already opened image, which is not closed.
+        """
+        
+        if isinstance(image, Image.Image):
+            img = image
+            image_path = Path(img.filename) if getattr(img, 'filename', None) else None
+        else:
+            img = None
+            image_path = image
         
         if not self.auto_format_conversion:
             # Keep original format if conversion is disabled
-            original_ext = image_path.suffix.lower()
-            if original_ext in ['.jpg', '.jpeg']:
-                return 'JPEG'
-            elif original_ext == '.png':
-                return 'PNG'
-            elif original_ext == '.gif':
-                return 'GIF'
-            elif original_ext == '.webp':
-                return 'WEBP'
-            else:
-                return 'JPEG'  # Fallback
+            if image_path is None:
+                return _EXT_TO_FMT.get(f".{(img.format or '').lower()}", 'JPEG')
+            return self._get_format_from_path(image_path)
         
         try:
+            if img is not None:
+                return self._analyze_format(img)
             with Image.open(image_path) as img:
-                # Check if image has animation (GIF)
-                if hasattr(img, 'is_animated') and img.is_animated:
-                    return 'GIF'
-                
-                # Check if image has transparency
-                has_transparency = (
-                    img.mode in ('RGBA', 'LA') or 
-                    (img.mode == 'P' and 'transparency' in img.info)
-                )
-                
-                if has_transparency:
-                    # PNG is better for images with transparency
-                    return 'PNG'
-                
-                # Check image characteristics
-                width, height = img.size
-                pixel_count = width * height
-                
-                # For small images or graphics, use PNG
-                if pixel_count < 100000:  # Less than ~300x300
-                    return 'PNG'
-                
-                # For large photos, use JPEG
-                return 'JPEG'
+                return self._analyze_format(img)
                 
         except Exception as e:
             self.logger.debug(f"Could not analyze image {image_path}: {e}")
             return 'JPEG'  # Safe fallback
     
-    def _process_image(self, input_path: Path, output_path: Path) -> Optional[Path]:
-        """Process and optimize image"""
+    def _analyze_format(self, img: Image.Image) -> str:
+        """Pick the output format from an open image's header information"""
+        # Check if image has animation (GIF)
+        if hasattr(img, 'is_animated') and img.is_animated:
+            return 'GIF'
+        
+        # Check if image has transparency
+        has_transparency = (
+            img.mode in ('RGBA', 'LA') or 
+            (img.mode == 'P' and 'transparency' in img.info)
+        )
+        
+        if has_transparency:
+            # PNG is better for images with transparency
+            return 'PNG'
+        
+        # Check image characteristics
+        width, height = img.size
+        pixel_count = width * height
+        
+        # For small images or graphics, use PNG
+        if pixel_count < 100000:  # Less than ~300x300
+            return 'PNG'
+        
+        # For large photos, use JPEG
+        return 'JPEG'
+    
+    def _process_image(self, input_path: Path, output_path: Path,
+                       img: Optional[Image.Image] = None,
+                       data: Optional[bytes] = None) -> Optional[Tuple[Path, Tuple[int, int]]]:
+        """Process and optimize image, returns output path and dimensions
         
+        img is the already opened, not yet loaded input; opened here if None.
+        """
+        
+        # Encode next to the target and rename it into place, so a crash or
+        # a full disk never leaves a truncated file under the final name.
+        # The temp name keeps the suffix the encoders pick the format from.
+        temp_path = output_path.with_name(
+            f".{output_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp{output_path.suffix}")
         try:
-            with Image.open(input_path) as img:
-                # Handle EXIF orientation
-                img = self._fix_orientation(img)
-                
-                # Convert mode if needed
-                img = self._convert_mode(img, output_path)
-                
-                # Resize image to target resolution
-                img = self._resize_image(img)
-                
-                # Apply sharpening if enabled
-                if self.enable_sharpening:
-                    img = self._apply_sharpening(img)
-                
-                # Save optimized image
-                self._save_optimized_image(img, output_path)
-                
-                return output_path
+            dimensions = self._encode_image(input_path, temp_path, img, data)
+            if dimensions is None:
+                return None
+            os.replace(temp_path, output_path)
+            return output_path, dimensions
+        
+        except OSError as e:
+            self.logger.error(f"Error writing optimized image {output_path}: {e}")
+            return None
+        finally:
+            try:
+                temp_path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.debug(f"Could not remove temporary file {temp_path}: {e}")
+    
+    def _encode_image(self, input_path: Path, output_path: Path,
+                      img: Optional[Image.Image] = None,
+                      data: Optional[bytes] = None) -> Optional[Tuple[int, int]]:
+        """Encode image to output_path with the fastest usable backend, returns dimensions"""
+        
+        output_format = self._get_format_from_path(output_path)
+        
+        if (self._backend == 'vips' and self.preserve_aspect_ratio and
+                output_format in _VIPS_FORMATS):
+            dimensions = self._process_image_vips(input_path, output_path, output_format, data)
+            if dimensions:
+                return dimensions
+            # Fall through to Pillow for anything libvips could not handle
+        
+        if (self._tj is not None and input_path.suffix.lower() in ('.jpg', '.jpeg') and
+                output_format == 'JPEG'):
+            orientation = img.getexif().get(ExifTags.Base.Orientation, 1) if img is not None else None
+            dimensions = self._process_image_turbojpeg(input_path, output_path, orientation, data)
+            if dimensions:
+                return dimensions
+        
+        try:
+            if img is None:
+                with Image.open(input_path) as img:
+                    return self._process_image_pillow(img, output_path)
+            return self._process_image_pillow(img, output_path)
                 
         except Exception as e:
             self.logger.error(f"Error processing image {input_path}: {e}")
             return None
     
+    def _process_image_pillow(self, img: Image.Image, output_path: Path) -> Tuple[int, int]:
+        """Decode, transform and encode an opened image with Pillow, returns output dimensions"""
+        # Let the JPEG decoder downscale before anything is decoded
+        self._apply_draft(img)
+        
+        # Handle EXIF orientation
+        img = self._fix_orientation(img)
+        
+        # Convert mode if needed
+        img = self._convert_mode(img, output_path)
+        
+        # Resize image to target resolution, sharpen if enabled
+        img = self._resize_and_sharpen(img)
+        
+        # Save optimized image
+        self._save_optimized_image(img, output_path)
+        
+        return img.size
+    
+    def _process_image_vips(self, input_path: Path, output_path: Path, output_format: str = 'JPEG',
+                            data: Optional[bytes] = None) -> Optional[Tuple[int, int]]:
+        """Process image to JPEG or WebP with libvips without decoding it at full size
+        
+        The operations below only build a lazy pipeline, libvips runs
+        orientation, shrink, sharpen, flatten and encode in one streaming pass.
+        """
+        try:
+            # thumbnail() applies EXIF orientation and uses JPEG shrink-on-load,
+            # size='down' never upscales, like _resize_image
+            if data is not None:
+                img = pyvips.Image.thumbnail_buffer(data, self.target_width,
+                                                    height=self.target_height, size='down')
+            else:
+                img = pyvips.Image.thumbnail(str(input_path), self.target_width,
+                                             height=self.target_height, size='down')
+            
+            if self.enable_sharpening:
+                img = img.sharpen(sigma=1.0, m2=1.2)
+            
+            # JPEG doesn't support transparency, WebP keeps it
+            if output_format == 'JPEG' and img.hasalpha():
+                img = img.flatten(background=[255, 255, 255])
+            
+            img.write_to_file(str(output_path), **self._vips_save_kwargs[output_format])
+            self.logger.debug(f"Saved optimized image with libvips: {output_path}")
+            return img.width, img.height
+            
+        except Exception as e:
+            self.logger.debug(f"libvips could not process {input_path}: {e}")
+            return None
+    
+    def _process_image_turbojpeg(self, input_path: Path, output_path: Path,
+                                 orientation: Optional[int] = None,
+                                 data: Optional[bytes] = None) -> Optional[Tuple[int, int]]:
+        """Decode and encode JPEG to JPEG with libjpeg-turbo"""
+        try:
+            if data is None:
+                data = input_path.read_bytes()
+            width, height, _, _ = self._tj.decode_header(data)
+            
+            if orientation is None:
+                # TurboJPEG ignores EXIF, read the orientation from the header
+                with Image.open(io.BytesIO(data)) as probe:
+                    orientation = probe.getexif().get(ExifTags.Base.Orientation, 1)
+            
+            scaling_factor = self._turbojpeg_scaling_factor(width, height, orientation)
+            pixels = self._tj.decode(data, pixel_format=TJPF_RGB, scaling_factor=scaling_factor)
+            
+            pixels = self._fix_orientation_np(pixels, orientation)
+            if self._use_cv2:
+                pixels = self._resize_and_sharpen_np(pixels)
+            else:
+                pixels = np.asarray(self._resize_and_sharpen(Image.fromarray(pixels)))
+            
+            output_path.write_bytes(self._tj.encode(
+                pixels, quality=self.quality_map['jpeg'], pixel_format=TJPF_RGB,
+                jpeg_subsample=TJSAMP_420,
+                flags=TJFLAG_PROGRESSIVE if self._thorough_jpeg else 0))
+            self.logger.debug(f"Saved optimized image with TurboJPEG: {output_path}")
+            return pixels.shape[1], pixels.shape[0]
+            
+        except Exception as e:
+            self.logger.debug(f"TurboJPEG could not process {input_path}: {e}")
+            return None
+    
+    def _turbojpeg_scaling_factor(self, width: int, height: int, orientation: int) -> Tuple[int, int]:
+        """Pick the smallest DCT scaling that still covers the target size"""
+        target_width, target_height = self.target_width, self.target_height
+        if orientation in (5, 6, 7, 8):
+            # Rotated by 90 degrees after decoding
+            target_width, target_height = target_height, target_width
+        
+        best = (1, 1)
+        for num, denom in self._tj.scaling_factors:
+            if num >= denom or num * best[1] >= best[0] * denom:
+                continue
+            if (-(-width * num // denom) >= target_width and
+                    -(-height * num // denom) >= target_height):
+                best = (num, denom)
+        return best
+    
+    def _apply_draft(self, img: Image.Image):
+        """Request JPEG DCT scaling (1/2, 1/4, 1/8) that still covers the target size"""
+        if img.format != 'JPEG':
+            return
+        
+        target_width, target_height = self.target_width, self.target_height
+        if img.getexif().get(ExifTags.Base.Orientation, 1) in (5, 6, 7, 8):
+            # Rotated by 90 degrees in _fix_orientation
+            target_width, target_height = target_height, target_width
+        
+        width, height = img.size
+        scale = min(width // target_width, height // target_height)
+        if scale >= 2:
+            img.draft('RGB', (width // scale, height // scale))
+            self.logger.debug(f"JPEG draft decode: {(width, height)} → {img.size}")
+    
     def _fix_orientation(self, img: Image.Image) -> Image.Image:
         """Fix image orientation based on EXIF data"""
         try:
@@ -208,6 +643,27 @@ class ImageOptimizer:
         
         return img
     
+    def _fix_orientation_np(self, pixels: 'np.ndarray', orientation: int) -> 'np.ndarray':
+        """Apply an EXIF orientation to an H x W x C array"""
+        if orientation == 2:
+            pixels = pixels[:, ::-1]
+        elif orientation == 3:
+            pixels = pixels[::-1, ::-1]
+        elif orientation == 4:
+            pixels = pixels[::-1]
+        elif orientation == 5:
+            pixels = pixels.swapaxes(0, 1)
+        elif orientation == 6:
+            pixels = np.rot90(pixels, -1)
+        elif orientation == 7:
+            pixels = pixels[::-1, ::-1].swapaxes(0, 1)
+        elif orientation == 8:
+            pixels = np.rot90(pixels)
+        else:
+            return pixels
+        # The flips above are views, encoders and OpenCV need contiguous rows
+        return np.ascontiguousarray(pixels)
+    
     def _convert_mode(self, img: Image.Image, output_path: Path) -> Image.Image:
         """Convert image mode based on output format"""
         
@@ -220,7 +676,9 @@ class ImageOptimizer:
                 background = Image.new('RGB', img.size, (255, 255, 255))
                 if img.mode == 'P':
                     img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+                # getchannel() extracts only the alpha band, split() would
+                # allocate all four
+                background.paste(img, mask=img.getchannel('A') if img.mode in ('RGBA', 'LA') else None)
                 img = background
             elif img.mode != 'RGB':
                 img = img.convert('RGB')
@@ -243,17 +701,40 @@ class ImageOptimizer:
         
         return img
     
-    def _resize_image(self, img: Image.Image) -> Image.Image:
-        """Resize image to target resolution while preserving aspect ratio"""
+    def _resize_and_sharpen(self, img: Image.Image) -> Image.Image:
+        """Resize to the target resolution and sharpen if enabled"""
+        if self._use_cv2 and img.mode in _CV2_MODES:
+            # One NumPy array through all OpenCV stages, back to PIL only
+            # for the encoder
+            return Image.fromarray(self._resize_and_sharpen_np(np.asarray(img)))
         
-        original_size = img.size
+        img = self._resize_image(img)
+        if self.enable_sharpening:
+            img = self._apply_sharpening(img)
+        return img
+    
+    def _resize_and_sharpen_np(self, pixels: 'np.ndarray') -> 'np.ndarray':
+        """Array version of _resize_and_sharpen (H x W or H x W x C uint8)"""
+        original_size = (pixels.shape[1], pixels.shape[0])
+        new_size = self._target_size(original_size)
+        if new_size:
+            pixels = self._resize_np(pixels, new_size)
+            self.logger.debug(f"Resized image: {original_size} → {new_size}")
+        
+        if self.enable_sharpening:
+            pixels = self._sharpen_np(pixels)
+            self.logger.debug("Applied image sharpening")
+        return pixels
+    
+    def _target_size(self, original_size: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """Size to resize to, None if the image already fits the target"""
         target_size = (self.target_width, self.target_height)
         
         # Skip resize if image is already smaller or same size
         if (original_size[0] <= target_size[0] and 
             original_size[1] <= target_size[1]):
             self.logger.debug(f"Image {original_size} smaller than target {target_size}, keeping original size")
-            return img
+            return None
         
         if self.preserve_aspect_ratio:
             # Calculate scaling factor to fit within target size
@@ -261,20 +742,53 @@ class ImageOptimizer:
             scale_y = target_size[1] / original_size[1]
             scale = min(scale_x, scale_y)
             
-            new_size = (
+            return (
                 int(original_size[0] * scale),
                 int(original_size[1] * scale)
             )
-        else:
-            # Stretch to exact target size
-            new_size = target_size
         
-        # Use high-quality resampling
-        img = img.resize(new_size, Image.Resampling.LANCZOS)
+        # Stretch to exact target size
+        return target_size
+    
+    def _resize_image(self, img: Image.Image) -> Image.Image:
+        """Resize image to target resolution while preserving aspect ratio"""
+        
+        original_size = img.size
+        new_size = self._target_size(original_size)
+        if not new_size:
+            return img
+        
+        img = img.resize(new_size, self._resample_filter(original_size, new_size), reducing_gap=2.0)
         
         self.logger.debug(f"Resized image: {original_size} → {new_size}")
         return img
     
+    def _resize_np(self, pixels: 'np.ndarray', new_size: Tuple[int, int]) -> 'np.ndarray':
+        """Area-average resize with OpenCV, Lanczos where an axis is enlarged"""
+        height, width = pixels.shape[:2]
+        if new_size[0] > width or new_size[1] > height:
+            # Stretch mode can enlarge one axis, INTER_AREA blurs and blocks there
+            return cv2.resize(pixels, new_size, interpolation=cv2.INTER_LANCZOS4)
+        # Integer area pre-shrink first, OpenCV's fast path, like Pillow's
+        # reducing_gap=2.0
+        factor = min(width // new_size[0], height // new_size[1]) // 2
+        if factor > 1:
+            pixels = cv2.resize(pixels, (width // factor, height // factor),
+                                interpolation=cv2.INTER_AREA)
+        return cv2.resize(pixels, new_size, interpolation=cv2.INTER_AREA)
+    
+    def _resample_filter(self, original_size: Tuple[int, int], new_size: Tuple[int, int]) -> Image.Resampling:
+        """Pick a resampling filter by how far the image is shrunk"""
+        scale = min(new_size[0] / original_size[0], new_size[1] / original_size[1])
+        
+        # Wide kernels buy nothing visible on large reductions
+        if scale <= 0.25:
+            return Image.Resampling.BOX
+        if scale <= 0.5:
+            return Image.Resampling.HAMMING
+        # Use high-quality resampling for mild shrinks
+        return Image.Resampling.LANCZOS
+    
     def _apply_sharpening(self, img: Image.Image) -> Image.Image:
         """Apply subtle sharpening to improve clarity"""
         try:
@@ -286,64 +800,103 @@ class ImageOptimizer:
         
         return img
     
+    def _sharpen_np(self, pixels: 'np.ndarray') -> 'np.ndarray':
+        """UnsharpMask(radius=1, percent=120, threshold=3) on an array"""
+        if self._torch is not None and pixels.shape[0] * pixels.shape[1] > GPU_SHARPEN_MIN_PIXELS:
+            return self._unsharp_mask_cuda(pixels)
+        
+        # Separable OpenCV blur
+        blurred = cv2.GaussianBlur(pixels, (0, 0), sigmaX=1.0)
+        # pixels + 1.2 * (pixels - blurred), saturated to 0..255
+        sharpened = cv2.addWeighted(pixels, 2.2, blurred, -1.2, 0)
+        # Like Pillow's threshold, leave pixels with little local contrast alone
+        np.copyto(sharpened, pixels, where=cv2.absdiff(pixels, blurred) < 3)
+        return sharpened
+    
+    def _init_cuda_sharpening(self):
+        """Set up the GPU unsharp mask if torch with CUDA is installed"""
+        # Imported here, torch takes seconds to import and is only worth it
+        # when sharpening is enabled
+        try:
+            import torch
+        except ImportError:
+            return
+        
+        if not torch.cuda.is_available():
+            return
+        
+        # 5x5 Gaussian, sigma 1, as one (1, 1, 5, 5) depthwise filter
+        offsets = torch.arange(-2, 3, dtype=torch.float32)
+        weights = torch.exp(-offsets ** 2 / 2)
+        weights /= weights.sum()
+        self._gaussian_kernel = torch.outer(weights, weights).view(1, 1, 5, 5).cuda()
+        self._torch = torch
+        self.logger.info("   Sharpening: CUDA")
+    
+    def _unsharp_mask_cuda(self, pixels: 'np.ndarray') -> 'np.ndarray':
+        """UnsharpMask(radius=1, percent=120, threshold=3) as a GPU convolution"""
+        torch = self._torch
+        functional = torch.nn.functional
+        
+        with torch.no_grad():
+            tensor = torch.from_numpy(np.ascontiguousarray(pixels)).cuda().float()
+            if tensor.ndim == 2:
+                tensor = tensor.unsqueeze(-1)
+            # HWC -> NCHW, one kernel per channel via groups
+            tensor = tensor.permute(2, 0, 1).unsqueeze(0)
+            channels = tensor.shape[1]
+            
+            padded = functional.pad(tensor, (2, 2, 2, 2), mode='reflect')
+            blurred = functional.conv2d(padded, self._gaussian_kernel.repeat(channels, 1, 1, 1),
+                                        groups=channels)
+            detail = tensor - blurred
+            sharpened = torch.where(detail.abs() >= 3, tensor + 1.2 * detail, tensor)
+            
+            result = (sharpened.clamp(0, 255).round().to(torch.uint8)
+                      .squeeze(0).permute(1, 2, 0).cpu().numpy())
+        
+        if pixels.ndim == 2:
+            result = result[..., 0]
+        return result
+    
     def _save_optimized_image(self, img: Image.Image, output_path: Path):
         """Save image with optimal compression settings"""
         
         output_format = self._get_format_from_path(output_path)
-        quality_settings = self.quality_map
         
-        save_kwargs = {}
+        if output_format == 'PNG' and self._save_png_oxipng(img, output_path):
+            return
         
-        if output_format == 'JPEG':
-            save_kwargs.update({
-                'format': 'JPEG',
-                'quality': quality_settings['jpeg'],
-                'optimize': True,
-                'progressive': True,  # Progressive JPEG for better perceived loading
-            })
-            
-        elif output_format == 'PNG':
-            save_kwargs.update({
-                'format': 'PNG',
-                'optimize': True,
-                'compress_level': quality_settings['png'],  # 0-9, higher = more compression
-            })
-            
-        elif output_format == 'WEBP':
-            save_kwargs.update({
-                'format': 'WEBP',
-                'quality': quality_settings['webp'],
-                'optimize': True,
-                'method': 6,  # Best compression method
-            })
-            
-        elif output_format == 'GIF':
-            save_kwargs.update({
-                'format': 'GIF',
-                'optimize': True,
-                'save_all': True,  # For animated GIFs
-            })
+        # Precomputed in __init__, see _create_save_kwargs
+        save_kwargs = self._save_kwargs_by_fmt[output_format]
         
         # Save the image
         img.save(output_path, **save_kwargs)
         self.logger.debug(f"Saved optimized image: {output_path} ({output_format}, quality: {save_kwargs.get('quality', 'N/A')})")
     
+    def _save_png_oxipng(self, img: Image.Image, output_path: Path) -> bool:
+        """Encode PNG with oxipng (libdeflate) instead of Pillow's zlib"""
+        if oxipng is None or img.mode not in _OXIPNG_COLOR_TYPES:
+            return False
+        
+        try:
+            color_type = getattr(oxipng.ColorType, _OXIPNG_COLOR_TYPES[img.mode])()
+            raw = oxipng.RawImage(img.tobytes(), img.width, img.height, color_type=color_type)
+            # Pillow levels 1-9 onto oxipng presets 0-3, higher presets only add time
+            level = min(self.quality_map['png'] // 3, 3)
+            output_path.write_bytes(raw.create_optimized_png(level=level))
+            self.logger.debug(f"Saved optimized image with oxipng: {output_path} (PNG, level: {level})")
+            return True
+        except Exception as e:
+            self.logger.debug(f"oxipng could not encode {output_path}: {e}")
+            return False
+    
     def _get_format_from_path(self, path: Path) -> str:
         """Get image format from file extension"""
-        ext = path.suffix.lower()
-        
-        if ext in ['.jpg', '.jpeg']:
-            return 'JPEG'
-        elif ext == '.png':
-            return 'PNG'
-        elif ext == '.gif':
-            return 'GIF'
-        elif ext == '.webp':
-            return 'WEBP'
-        else:
-            return 'JPEG'  # Fallback
+        return _EXT_TO_FMT.get(path.suffix.lower(), 'JPEG')
     
-    def _log_optimization_results(self, input_path: Path, output_path: Path):
+    def _log_optimization_results(self, input_path: Path, output_path: Path,
+                                  dimensions: Tuple[int, int]):
         """Log optimization results for monitoring"""
         try:
             input_size = input_path.stat().st_size
@@ -354,24 +907,16 @@ class ImageOptimizer:
             self.logger.info(f"📸 Image optimized: {input_path.name} → {output_path.name}")
             self.logger.info(f"   Size: {self._format_bytes(input_size)} → {self._format_bytes(output_size)} "
                            f"({reduction_percent:+.1f}%)")
-            
-            # Get image dimensions
-            try:
-                with Image.open(output_path) as img:
-                    self.logger.info(f"   Resolution: {img.size[0]}x{img.size[1]}")
-            except:
-                pass
+            self.logger.info(f"   Resolution: {dimensions[0]}x{dimensions[1]}")
                 
         except Exception as e:
             self.logger.debug(f"Could not log optimization results: {e}")
     
     def _format_bytes(self, bytes_value: int) -> str:
         """Format bytes in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.1f}{unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f}TB"
+        # Each unit step is 10 bits, so the unit index falls out of the bit length
+        index = min(max(int(abs(bytes_value)).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+        return f"{bytes_value / (1 << (10 * index)):.1f}{_SIZE_UNITS[index]}"
     
     def get_optimization_stats(self) -> Dict[str, Any]:
         """Get optimization statistics"""
@@ -401,8 +946,12 @@ class ImageOptimizer:
                 original_mode = img.mode
                 original_format = img.format
             
-            # Perform optimization
-            optimized_path = self.optimize_image(test_image_path)
+            # Perform optimization into a private file, the content-addressed
+            # name may hold a real result from an earlier run
+            cached_path = self._generate_optimized_path(test_image_path)
+            test_output_path = cached_path.with_name(
+                f".test.{os.getpid()}.{threading.get_ident()}.{cached_path.name}")
+            optimized_path = self.optimize_image(test_image_path, test_output_path)
             
             if optimized_path and optimized_path != test_image_path:
                 # Get optimized info
@@ -416,11 +965,12 @@ class ImageOptimizer:
                 # Calculate savings
                 size_reduction = ((original_size - optimized_size) / original_size) * 100
                 
-                # Clean up test file
-                try:
-                    optimized_path.unlink()
-                except:
-                    pass
+                # Clean up test file, never a file this call did not write
+                if optimized_path == test_output_path:
+                    try:
+                        optimized_path.unlink()
+                    except OSError:
+                        pass
                 
                 return {
                     'success': True,
@@ -479,30 +1029,24 @@ class ImageOptimizer:
                 'errors': []
             }
             
-            for image_file in image_files:
-                try:
-                    original_size = image_file.stat().st_size
+            # Files are independent and CPU bound, spread them over all cores
+            max_workers = min(os.cpu_count() or 1, len(image_files))
+            # Spawned, not forked: a fork would copy the thread pools of
+            # oxipng/OpenCV without their threads and can hang the worker
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_worker,
+                                     initargs=self._worker_settings()) as executor:
+                file_results = self._run_batch_pipeline(image_files, executor, max_workers)
+                for success, original_size, optimized_size, error in file_results:
                     results['total_original_size'] += original_size
-                    
-                    optimized_path = self.optimize_image(image_file)
-                    
-                    if optimized_path and optimized_path.exists():
-                        optimized_size = optimized_path.stat().st_size
-                        results['total_optimized_size'] += optimized_size
+                    # Failed files count with their original size
+                    results['total_optimized_size'] += optimized_size
+                    if success:
                         results['successful'] += 1
                     else:
-                        results['total_optimized_size'] += original_size
                         results['failed'] += 1
-                        results['errors'].append(f"Optimization failed for {image_file.name}")
-                        
-                except Exception as e:
-                    results['failed'] += 1
-                    results['errors'].append(f"Error processing {image_file.name}: {e}")
-                    # Add original size to avoid division by zero
-                    try:
-                        results['total_optimized_size'] += image_file.stat().st_size
-                    except:
-                        pass
+                        results['errors'].append(error)
             
             # Calculate total savings
             if results['total_original_size'] > 0:
@@ -518,6 +1062,108 @@ class ImageOptimizer:
         except Exception as e:
             return {'error': f'Batch optimization failed: {e}'}
 
+    def _run_batch_pipeline(self, image_files: List[Path], executor: ProcessPoolExecutor,
+                            workers: int) -> List[Tuple[bool, int, int, Optional[str]]]:
+        """Read files on a thread while the worker processes optimize earlier ones"""
+        # Bounded, reading stays at most BATCH_READ_AHEAD files ahead
+        read_queue: queue.Queue = queue.Queue(maxsize=BATCH_READ_AHEAD)
+        stop_reading = threading.Event()
+        results = []
+        
+        def read_files():
+            for image_file in image_files:
+                if stop_reading.is_set():
+                    return
+                try:
+                    read_queue.put((image_file, image_file.read_bytes(), None))
+                except OSError as e:
+                    read_queue.put((image_file, None, e))
+            read_queue.put(None)
+        
+        reader = threading.Thread(target=read_files, name="BatchReader", daemon=True)
+        reader.start()
+        pending = set()
+        try:
+            while True:
+                item = read_queue.get()
+                if item is None:
+                    break
+                image_file, data, error = item
+                if error is not None:
+                    results.append((False, 0, 0, f"Error processing {image_file.name}: {error}"))
+                    continue
+                
+                # At most one file per worker in flight, the rest waits read
+                if len(pending) >= workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    results.extend(future.result() for future in done)
+                pending.add(executor.submit(_optimize_one, str(image_file), data))
+            
+            results.extend(future.result() for future in wait(pending).done)
+        finally:
+            # On error, unblock the reader so it can exit
+            stop_reading.set()
+            while reader.is_alive():
+                try:
+                    read_queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+        
+        return results
+    
+    def _worker_settings(self) -> Tuple[Tuple[int, int], Dict[str, Any]]:
+        """Picklable copy of the settings for batch worker processes"""
+        return (self.target_width, self.target_height), {
+            'image_optimization': self.optimization_enabled,
+            'compress_level': self.compress_level,
+            'auto_format_conversion': self.auto_format_conversion,
+            'preserve_aspect_ratio': self.preserve_aspect_ratio,
+            'enable_sharpening': self.enable_sharpening,
+            # One CUDA context and copy of the kernel per worker would
+            # multiply GPU memory, workers sharpen with OpenCV or Pillow
+            'cuda_sharpening': False,
+            'max_quality': self.max_quality,
+            'min_quality': self.min_quality,
+        }
+
+
+class _WorkerConfig:
+    """Minimal config object rebuilt inside batch worker processes"""
+    
+    def __init__(self, resolution: Tuple[int, int], settings: Dict[str, Any]):
+        self._resolution = resolution
+        for key, value in settings.items():
+            setattr(self, key, value)
+    
+    def get_display_resolution(self) -> Tuple[int, int]:
+        return self._resolution
+
+
+# Optimizer of the current batch worker process, set by _init_worker
+_worker_optimizer: Optional[ImageOptimizer] = None
+
+
+def _init_worker(resolution: Tuple[int, int], settings: Dict[str, Any]):
+    """Create the optimizer once per worker process"""
+    global _worker_optimizer
+    _worker_optimizer = ImageOptimizer(_WorkerConfig(resolution, settings))
+
+
+def _optimize_one(path_str: str, data: Optional[bytes] = None) -> Tuple[bool, int, int, Optional[str]]:
+    """Optimize one file in a worker, returns (success, in_size, out_size, error)"""
+    image_file = Path(path_str)
+    original_size = 0
+    try:
+        original_size = len(data) if data is not None else image_file.stat().st_size
+        optimized_path = _worker_optimizer.optimize_image(image_file, data=data)
+        
+        if optimized_path and optimized_path.exists():
+            return True, original_size, optimized_path.stat().st_size, None
+        return False, original_size, original_size, f"Optimization failed for {image_file.name}"
+        
+    except Exception as e:
+        return False, original_size, original_size, f"Error processing {image_file.name}: {e}"
+
 
 if __name__ == "__main__":
     """Test image optimizer functionality"""
@@ -5,14 +5,24 @@ Complete implementation with robust error handling and monitor management
 """
 
 import asyncio
-import atexit
+import errno
 import logging
 import os
+import random
 import signal
 import sys
-import time
+import warnings
 from pathlib import Path
-from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Suppress asyncio warnings for library tasks still pending at shutdown,
+# set before any event loop exists so it also covers importers of this module
+warnings.filterwarnings("ignore", category=RuntimeWarning, message=".*was destroyed but it is pending.*")
 
 # Load configuration first to get SDL settings
 from config import TeleFrameConfig
@@ -26,10 +36,55 @@ config.setup_sdl_environment()
 import pygame
 from image_manager import ImageManager
 from slideshow import SlideshowDisplay
-from telegram_bot import TeleFrameBot
+from telegram_bot import TeleFrameBot, InvalidBotTokenError
+from telegram.error import Conflict, Forbidden, InvalidToken
 from monitor_control import MonitorController  # NEW: Monitor control
 from logger import setup_logger, setup_security_logger
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Seconds between pygame input polls in the main loop
+INPUT_POLL_INTERVAL = 0.05
+
+# Events that mean the window contents were lost and must be repainted,
+# WINDOWEXPOSED only exists on pygame 2
+_EXPOSE_EVENTS = tuple(
+    getattr(pygame, name) for name in ('VIDEOEXPOSE', 'WINDOWEXPOSED') if hasattr(pygame, name)
+)
+
+
+def _caused_by(error: BaseException, error_types) -> bool:
+    """Check error and the exceptions it was raised from against error_types"""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, error_types):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _try_lock(fd: int) -> bool:
+    """Take an exclusive non-blocking lock on fd, False if another process holds it"""
+    if fcntl is not None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+    
+    try:
+        # Windows: lock the first byte, released when the fd is closed
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError as e:
+        if e.errno in (errno.EACCES, errno.EDEADLOCK):
+            return False
+        raise
+    return True
+
 
 class ProcessManager:
     """Handle process locking and cleanup"""
@@ -37,59 +92,49 @@ class ProcessManager:
     def __init__(self, app_name: str = "teleframe", config=None):
         self.app_name = app_name
         self.config = config  # FIXED: Add config parameter
-        self.pid_file = Path(f"/tmp/{app_name}.pid")
+        self.pid = os.getpid()
         self.lock_file = Path(f"/tmp/{app_name}.lock")
+        self._lock_fd = None
         self.logger = logging.getLogger(f"{app_name}.process")
-        
-    def is_running(self) -> bool:
-        """Check if another instance is running"""
-        if not self.pid_file.exists():
-            return False
-            
-        try:
-            with open(self.pid_file, 'r') as f:
-                pid = int(f.read().strip())
-            
-            # Check if process exists
-            try:
-                os.kill(pid, 0)  # Signal 0 = check if process exists
-                return True
-            except ProcessLookupError:
-                # Process doesn't exist, clean up stale PID file
-                self.pid_file.unlink(missing_ok=True)
-                return False
-                
-        except (ValueError, FileNotFoundError):
-            return False
     
     def create_lock(self) -> bool:
-        """Create process lock"""
-        if self.is_running():
-            return False
-            
+        """Create process lock, False if another instance holds it
+        
+        The lock is an flock (an msvcrt byte lock on Windows) on the open
+        lock file, held until the fd is closed. The OS drops it when the
+        process dies, so there is no stale lock to detect.
+        
+        Raises OSError if the lock file can't be used.
+        """
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
         try:
-            # Write current PID
-            with open(self.pid_file, 'w') as f:
-                f.write(str(os.getpid()))
-            
-            # Create lock file
-            self.lock_file.touch()
-            
-            # Register cleanup on exit
-            atexit.register(self.cleanup)
-            
-            self.logger.info(f"Process lock created: PID {os.getpid()}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Error creating lock: {e}")
+            locked = _try_lock(fd)
+        except OSError:
+            os.close(fd)
+            raise
+        if not locked:
+            os.close(fd)
             return False
+        
+        # Record current PID for ps/kill diagnostics
+        os.ftruncate(fd, 0)
+        os.write(fd, str(self.pid).encode())
+        # No atexit hook needed, the kernel releases the lock with the process
+        self._lock_fd = fd
+        
+        self.logger.info(f"Process lock created: PID {self.pid}")
+        return True
     
     def cleanup(self):
-        """Clean up lock files"""
+        """Release process lock"""
+        if self._lock_fd is None:
+            return
+        
         try:
-            self.pid_file.unlink(missing_ok=True)
-            self.lock_file.unlink(missing_ok=True)
+            # Closing the fd releases the lock; the file stays, unlinking it
+            # would let a new instance lock a different inode than a waiter
+            os.close(self._lock_fd)
+            self._lock_fd = None
             self.logger.info("Process lock cleaned up")
         except Exception as e:
             self.logger.error(f"Error cleaning up lock: {e}")
@@ -119,63 +164,78 @@ class TeleFrame:
         self.bot = None
         self.monitor_controller = None  # NEW: Monitor controller
         
+        # Keyboard shortcuts, key code -> async handler; left/right are
+        # navigation and go through _navigation_step
+        self._key_handlers = {
+            pygame.K_ESCAPE: self._key_quit,
+            pygame.K_q: self._key_quit,
+            pygame.K_SPACE: self._key_toggle_pause,
+            # NEW: Monitor control shortcuts (for debugging/testing)
+            pygame.K_m: self._key_toggle_monitor,
+            pygame.K_s: self._key_monitor_status,
+        }
+        
         # State
         self.running = False
         self.shutdown_requested = False
         
-        # Setup signal handlers
-        self._setup_signal_handlers()
+        # Main loop scheduling: the slideshow timer sets a flag and wakes
+        # the loop, the monitor schedule runs as its own task
+        self._wakeup = None
+        self._advance_due = False
+        self._advance_handle = None
+        self._monitor_task = None
+        self._stop_task = None
+        self._cleanup_task = None
         
         self.logger.info("TeleFrame initialized")
     
-    def _setup_signal_handlers(self):
-        """Setup graceful shutdown signal handlers"""
-        def signal_handler(signum, frame):
-            signal_name = signal.Signals(signum).name
-            self.logger.info(f"Received signal {signal_name}")
-            
-            # Set shutdown flag immediately
-            self.shutdown_requested = True
-            
-            # Schedule graceful shutdown (don't block signal handler)
-            if self.running:
-                # Create shutdown task without blocking
-                def schedule_shutdown():
-                    loop = None
-                    try:
-                        loop = asyncio.get_running_loop()
-                    except RuntimeError:
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            pass
-                    
-                    if loop and not loop.is_closed():
-                        loop.create_task(self.stop())
-                
-                schedule_shutdown()
+    def _setup_signal_handlers(self, loop: asyncio.AbstractEventLoop):
+        """Setup graceful shutdown signal handlers on the running loop"""
+        signals = [signal.SIGINT, signal.SIGTERM]  # Ctrl+C, systemctl stop
+        if hasattr(signal, 'SIGHUP'):  # Not available on Windows
+            signals.append(signal.SIGHUP)  # Reload config
         
-        # Register signal handlers
-        signal.signal(signal.SIGINT, signal_handler)   # Ctrl+C
-        signal.signal(signal.SIGTERM, signal_handler)  # systemctl stop
+        for signum in signals:
+            try:
+                # Runs the handler as a loop callback, not in signal context;
+                # the name is resolved here once instead of on every delivery
+                loop.add_signal_handler(signum, self._handle_signal, signum.name)
+            except NotImplementedError:
+                # Windows event loops: plain signal handler that only hands
+                # the signal over to the loop
+                signal.signal(signum, lambda _signum, _frame, name=signum.name:
+                              loop.call_soon_threadsafe(self._handle_signal, name))
+    
+    def _handle_signal(self, signal_name: str):
+        """Request graceful shutdown from a signal"""
+        self.logger.info(f"Received signal {signal_name}")
         
-        if hasattr(signal, 'SIGHUP'):  # Not available on Windows
-            signal.signal(signal.SIGHUP, signal_handler)  # Reload config
+        # Set shutdown flag immediately and wake the main loop so it exits
+        self.shutdown_requested = True
+        if self._wakeup:
+            self._wakeup.set()
+        
+        if self.running and self._stop_task is None:
+            self._stop_task = asyncio.create_task(self.stop())
     
     async def start(self):
         """Start TeleFrame application with robust error handling"""
-        # Check if already running
-        if self.process_manager.is_running():
+        self._setup_signal_handlers(asyncio.get_running_loop())
+        
+        # Create process lock, fails if already running
+        try:
+            locked = self.process_manager.create_lock()
+        except OSError as e:
+            self.logger.error(f"❌ Could not create process lock: {e}")
+            sys.exit(1)
+        
+        if not locked:
             self.logger.error("❌ Another TeleFrame instance is already running!")
             self.logger.error("   Check with: ps aux | grep main.py")
             self.logger.error("   Kill with: pkill -f 'python.*main.py'")
             sys.exit(1)
         
-        # Create process lock
-        if not self.process_manager.create_lock():
-            self.logger.error("❌ Could not create process lock")
-            sys.exit(1)
-        
         self.logger.info("🚀 Starting TeleFrame...")
         self.running = True
         
@@ -195,7 +255,7 @@ class TeleFrame:
             raise
             
         finally:
-            await self._cleanup()
+            await self._cleanup_with_timeout()
     
     async def _initialize_components(self):
         """Initialize all components with monitor controller"""
@@ -223,70 +283,86 @@ class TeleFrame:
             self.logger.error(f"❌ Component initialization failed: {e}")
             raise
     
-    async def _init_display_with_retry(self, max_retries: int = 3):
-        """Initialize display with retry logic"""
+    async def _retry(self, fn, max_retries: int, on_error, max_delay: float = 120.0):
+        """Await fn() until it succeeds or max_retries attempts have failed
+        
+        on_error(error, attempt) logs the failure and returns the base delay
+        before the next attempt, or None to give up; it may also raise. Delays
+        use decorrelated jitter, so frames recovering from the same outage
+        don't hit the Telegram API in lockstep. The last error is re-raised.
+        """
+        delay = 0.0
         for attempt in range(max_retries):
             try:
-                self.display = SlideshowDisplay(self.config, self.image_manager)
-                await self.display.initialize()
-                self.logger.info("✅ Display initialized successfully")
-                return
-                
+                return await fn()
             except Exception as e:
-                self.logger.warning(f"Display init attempt {attempt + 1}/{max_retries} failed: {e}")
-                
-                if attempt == max_retries - 1:
-                    self.logger.error("❌ All display initialization attempts failed")
-                    self.logger.error("🔧 Troubleshooting tips:")
-                    self.logger.error("   - Check framebuffer: ls -la /dev/fb*")
-                    self.logger.error("   - Check video group: groups $USER")
-                    self.logger.error("   - Try: sudo usermod -a -G video $USER")
+                base_delay = on_error(e, attempt)
+                if base_delay is None or attempt == max_retries - 1:
                     raise
                 
-                await asyncio.sleep(2)  # Wait before retry
+                delay = min(max_delay, random.uniform(base_delay, max(base_delay, delay * 3)))
+                self.logger.info(f"   Waiting {delay:.1f}s before retry...")
+                await asyncio.sleep(delay)
+    
+    async def _init_display_with_retry(self, max_retries: int = 3):
+        """Initialize display with retry logic"""
+        async def init_display():
+            self.display = SlideshowDisplay(self.config, self.image_manager)
+            await self.display.initialize()
+        
+        def on_error(e, attempt):
+            self.logger.warning(f"Display init attempt {attempt + 1}/{max_retries} failed: {e}")
+            
+            if attempt == max_retries - 1:
+                self.logger.error("❌ All display initialization attempts failed")
+                self.logger.error("🔧 Troubleshooting tips:")
+                self.logger.error("   - Check framebuffer: ls -la /dev/fb*")
+                self.logger.error("   - Check video group: groups $USER")
+                self.logger.error("   - Try: sudo usermod -a -G video $USER")
+            return 2.0
+        
+        await self._retry(init_display, max_retries, on_error)
+        self.logger.info("✅ Display initialized successfully")
     
     async def _init_bot_with_retry(self, max_retries: int = 5):
         """Initialize bot with monitor controller and retry logic"""
-        for attempt in range(max_retries):
-            try:
-                # NEW: Pass monitor controller to bot
+        async def start_bot():
+            # NEW: Pass monitor controller to bot
+            # Keep the bot (and its HTTP connection pool) across retries
+            if self.bot is None:
                 self.bot = TeleFrameBot(self.config, self.image_manager, self.monitor_controller, self.display)
+            await self.bot.start()
+        
+        def on_error(e, attempt):
+            # TeleFrameBot re-raises Telegram errors wrapped in its own
+            # messages, the original is kept on the exception chain
+            if _caused_by(e, Conflict):
+                self.logger.warning(f"🔄 Bot conflict detected (attempt {attempt + 1}/{max_retries})")
+                self.logger.warning("   Another bot instance may be running...")
                 
-                await self.bot.start()
-                self.logger.info("✅ Telegram bot started successfully")
-                return
+                if attempt == max_retries - 1:
+                    self.logger.error("❌ Bot startup failed: Multiple instances detected")
+                    self.logger.error("🔧 Resolution steps:")
+                    self.logger.error("   1. Stop other bot instances: pkill -f telegram")
+                    self.logger.error("   2. Wait 30 seconds for Telegram API cleanup")
+                    self.logger.error("   3. Restart TeleFrame")
+                    raise RuntimeError("Bot conflict: Another instance running") from e
                 
-            except Exception as e:
-                error_msg = str(e).lower()
+                # Telegram needs a while to drop the other long-poll session
+                return 10.0
                 
-                if "conflict" in error_msg or "terminated by other" in error_msg:
-                    self.logger.warning(f"🔄 Bot conflict detected (attempt {attempt + 1}/{max_retries})")
-                    self.logger.warning("   Another bot instance may be running...")
-                    
-                    if attempt == max_retries - 1:
-                        self.logger.error("❌ Bot startup failed: Multiple instances detected")
-                        self.logger.error("🔧 Resolution steps:")
-                        self.logger.error("   1. Stop other bot instances: pkill -f telegram")
-                        self.logger.error("   2. Wait 30 seconds for Telegram API cleanup")
-                        self.logger.error("   3. Restart TeleFrame")
-                        raise RuntimeError("Bot conflict: Another instance running")
-                    
-                    # Exponential backoff for conflicts
-                    wait_time = 10 * (2 ** attempt)
-                    self.logger.info(f"   Waiting {wait_time}s before retry...")
-                    await asyncio.sleep(wait_time)
-                    
-                elif "unauthorized" in error_msg or "token" in error_msg:
-                    self.logger.error("❌ Bot authentication failed")
-                    self.logger.error("🔧 Check your bot token in config.toml")
-                    self.logger.error("   Get token from @BotFather on Telegram")
-                    raise
-                    
-                else:
-                    self.logger.error(f"❌ Bot startup failed: {e}")
-                    if attempt == max_retries - 1:
-                        raise
-                    await asyncio.sleep(5)
+            elif _caused_by(e, (InvalidBotTokenError, Forbidden, InvalidToken)):
+                self.logger.error("❌ Bot authentication failed")
+                self.logger.error("🔧 Check your bot token in config.toml")
+                self.logger.error("   Get token from @BotFather on Telegram")
+                return None
+                
+            else:
+                self.logger.error(f"❌ Bot startup failed: {e}")
+                return 5.0
+        
+        await self._retry(start_bot, max_retries, on_error)
+        self.logger.info("✅ Telegram bot started successfully")
     
     async def stop(self):
         """Graceful shutdown with proper timeout handling"""
@@ -301,6 +377,18 @@ class TeleFrame:
         await self._cleanup_with_timeout()
     
     async def _cleanup_with_timeout(self):
+        """Clean up all resources, runs once and every caller waits for it
+        
+        stop() (from a signal) and start()'s finally both get here; the first
+        call starts the cleanup task and later ones await the same task
+        instead of returning while it is still running.
+        """
+        if self._cleanup_task is None:
+            self._cleanup_task = asyncio.ensure_future(self._cleanup())
+        # A cancelled caller must not cancel the cleanup itself
+        await asyncio.shield(self._cleanup_task)
+    
+    async def _cleanup(self):
         """Clean up all resources with timeout protection"""
         self.logger.info("🧹 Cleaning up resources...")
         
@@ -314,27 +402,33 @@ class TeleFrame:
         if self.display:
             cleanup_tasks.append(self._cleanup_display_safely())
         
-        # NEW: Clean up monitor controller (synchronous)
+        # NEW: Log final monitor state
         if self.monitor_controller:
-            try:
-                # Log final monitor state
-                status = self.monitor_controller.get_status()
-                self.logger.info(f"🖥️  Final monitor state: {status['state']}")
-            except Exception as e:
-                self.logger.error(f"Error getting final monitor status: {e}")
+            cleanup_tasks.append(self._log_monitor_state_safely())
         
         # Execute all cleanup tasks with timeout
         if cleanup_tasks:
             try:
-                await asyncio.wait_for(
-                    asyncio.gather(*cleanup_tasks, return_exceptions=True),
-                    timeout=10.0  # 10 second timeout
-                )
+                if hasattr(asyncio, 'TaskGroup'):  # Python 3.11+
+                    # Leaving the timeout cancels and awaits every child task
+                    async with asyncio.timeout(10.0):  # 10 second timeout
+                        async with asyncio.TaskGroup() as group:
+                            for cleanup_task in cleanup_tasks:
+                                group.create_task(cleanup_task)
+                else:
+                    await asyncio.wait_for(asyncio.gather(*cleanup_tasks), timeout=10.0)
             except asyncio.TimeoutError:
                 self.logger.warning("⏰ Cleanup timeout - forcing shutdown")
             except Exception as e:
                 self.logger.error(f"Error during cleanup: {e}")
         
+        # Persist pending image metadata changes (synchronous)
+        if self.image_manager:
+            try:
+                self.image_manager.flush()
+            except Exception as e:
+                self.logger.error(f"Error saving image metadata: {e}")
+        
         # Clean up pygame (synchronous)
         try:
             pygame.quit()
@@ -358,6 +452,15 @@ class TeleFrame:
         except Exception as e:
             self.logger.error(f"Error stopping bot: {e}")
     
+    async def _log_monitor_state_safely(self):
+        """Log final monitor state with proper exception handling"""
+        try:
+            # monitor_state is all get_status() would be needed for here
+            state = "ON" if self.monitor_controller.monitor_state else "OFF"
+            self.logger.info(f"🖥️  Final monitor state: {state}")
+        except Exception as e:
+            self.logger.error(f"Error getting final monitor status: {e}")
+    
     async def _cleanup_display_safely(self):
         """Clean up display with proper exception handling"""
         try:
@@ -368,84 +471,165 @@ class TeleFrame:
         except Exception as e:
             self.logger.error(f"Error cleaning up display: {e}")
     
-    async def _cleanup(self):
-        """Legacy cleanup method - now calls new timeout version"""
-        await self._cleanup_with_timeout()
+    def _schedule_advance(self):
+        """Arm the slideshow timer, fires once per interval"""
+        loop = asyncio.get_running_loop()
+        self._advance_handle = loop.call_later(self.config.interval / 1000.0, self._on_advance)
+    
+    def _on_advance(self):
+        """Slideshow timer callback, runs on the event loop"""
+        self._advance_due = True
+        self._wakeup.set()
+        self._schedule_advance()
+    
+    async def _monitor_schedule_task(self):
+        """Check the monitor on/off schedule every minute"""
+        while self.running:
+            await asyncio.sleep(60.0)
+            try:
+                await self.monitor_controller.check_schedule()
+            except Exception as e:
+                self.logger.error("Error checking monitor schedule: %s", e)
+    
+    def _cancel_timers(self):
+        """Cancel the slideshow timer and the monitor schedule task"""
+        if self._advance_handle:
+            self._advance_handle.cancel()
+            self._advance_handle = None
+        if self._monitor_task:
+            self._monitor_task.cancel()
+            self._monitor_task = None
     
     async def _main_loop(self):
-        """Main application loop with monitor control integration"""
+        """Main application loop with monitor control integration
+        
+        Slide changes are driven by a loop timer and monitor checks by a
+        background task instead of comparing ticks every frame. Between
+        frames the loop awaits instead of blocking in pygame's clock, so
+        the bot keeps running on the same loop.
+        """
         self.logger.info("🎬 Starting main loop...")
         
-        clock = pygame.time.Clock()
-        last_image_change = 0
-        last_monitor_check = 0  # FIXED: Initialize variable
-        monitor_check_interval = 60000  # Check every minute
+        # SDL events must be pumped on this thread, so input is polled; the
+        # display only redraws when its state changed, timers wake the loop
+        poll_interval = INPUT_POLL_INTERVAL
         error_count = 0
         max_errors = 10
-        current_time = 0  # FIXED: Initialize variable
         
-        while self.running and not self.shutdown_requested:
-            try:
-                current_time = pygame.time.get_ticks()
-                
-                # NEW: Monitor control check (every minute)
-                if (self.monitor_controller and 
-                    (current_time - last_monitor_check) >= monitor_check_interval):
+        # Only queue the events _handle_event acts on; everything is allowed
+        # by default, so block all types first
+        try:
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN,
+                                      pygame.VIDEORESIZE, *_EXPOSE_EVENTS])
+        except pygame.error as e:
+            self.logger.debug("Could not filter pygame events: %s", e)
+        
+        self._wakeup = asyncio.Event()
+        self._schedule_advance()
+        if self.monitor_controller:
+            self._monitor_task = asyncio.create_task(self._monitor_schedule_task())
+        
+        # Components and config are fixed while the loop runs, bind what
+        # every frame touches to locals once
+        display = self.display
+        monitor_controller = self.monitor_controller
+        gate_on_monitor = bool(monitor_controller and self.config.toggle_monitor)
+        event_get = pygame.event.get
+        handle_events = self._handle_events
+        wakeup = self._wakeup
+        wait_for = asyncio.wait_for
+        monitor_was_on = True
+        
+        try:
+            while self.running and not self.shutdown_requested:
+                try:
+                    # Handle pygame events
+                    events = event_get()
+                    if events:
+                        await handle_events(events)
                     
-                    await self.monitor_controller.check_schedule()
-                    last_monitor_check = current_time
-                
-                # Handle pygame events
-                for event in pygame.event.get():
-                    await self._handle_event(event)
-                
-                # NEW: Auto-advance slideshow (only if monitor is on or monitor control disabled)
-                should_advance = True
-                if self.monitor_controller and self.config.toggle_monitor:
-                    should_advance = self.monitor_controller.monitor_state
-                
-                if (should_advance and 
-                    self.display and 
-                    not self.display.is_paused and 
-                    (current_time - last_image_change) >= self.config.interval):
+                    # NEW: Monitor state gates both slideshow advance and redraw
+                    monitor_on = monitor_controller.monitor_state if gate_on_monitor else True
+                    if monitor_on and not monitor_was_on and display:
+                        # Repaint whatever the screen lost while it was off
+                        display.needs_redraw = True
+                    monitor_was_on = monitor_on
                     
-                    await self.display.next_image()
-                    last_image_change = current_time
-                
-                # NEW: Update display (only if monitor is on or monitor control disabled)
-                if self.display:
-                    should_update = True
-                    if self.monitor_controller and self.config.toggle_monitor:
-                        should_update = self.monitor_controller.monitor_state
+                    # Auto-advance slideshow (only if monitor is on or monitor control disabled)
+                    if self._advance_due:
+                        self._advance_due = False
+                        if monitor_on and display and not display.is_paused:
+                            await display.next_image()
                     
-                    if should_update:
-                        self.display.update()
-                
-                # Maintain framerate
-                clock.tick(60)
-                
-                # Small async yield
-                await asyncio.sleep(0.001)
-                
-                # Reset error count on successful iterations
-                error_count = 0
-                
-            except KeyboardInterrupt:
-                break
-                
-            except Exception as e:
-                error_count += 1
-                self.logger.error(f"Error in main loop iteration {error_count}: {e}")
-                
-                if error_count >= max_errors:
-                    self.logger.error(f"❌ Too many errors ({max_errors}), shutting down")
+                    # Update display (only if monitor is on or monitor control
+                    # disabled) and only when something changed
+                    if display and monitor_on and display.needs_redraw:
+                        display.update()
+                    
+                    # Sleep until the next input poll or a timer, whichever comes first
+                    try:
+                        await wait_for(wakeup.wait(), timeout=poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    wakeup.clear()
+                    
+                    # Reset error count on successful iterations
+                    error_count = 0
+                    
+                except KeyboardInterrupt:
                     break
-                
-                # Brief pause before retry
-                await asyncio.sleep(0.1)
+                    
+                except Exception as e:
+                    error_count += 1
+                    self.logger.error("Error in main loop iteration %d: %s", error_count, e)
+                    
+                    if error_count >= max_errors:
+                        self.logger.error("❌ Too many errors (%d), shutting down", max_errors)
+                        break
+                    
+                    # Brief pause before retry
+                    await asyncio.sleep(0.1)
+        finally:
+            self._cancel_timers()
         
         self.logger.info("🏁 Main loop finished")
     
+    async def _handle_events(self, events: list):
+        """Handle all pending pygame events, coalescing slideshow navigation
+        
+        Next/previous presses and taps are summed and applied as one move, so a
+        burst of input loads and draws only the image it ends on.
+        """
+        steps = 0
+        for event in events:
+            step = self._navigation_step(event)
+            if step:
+                steps += step
+            else:
+                await self._handle_event(event)
+        
+        if steps and self.display:
+            try:
+                await self.display.advance_by(steps)
+            except Exception as e:
+                self.logger.error("Error changing image: %s", e)
+    
+    def _navigation_step(self, event) -> int:
+        """+1 for next image, -1 for previous image, 0 for any other event"""
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RIGHT:
+                return 1
+            if event.key == pygame.K_LEFT:
+                return -1
+        elif event.type == pygame.MOUSEBUTTONDOWN and self.display:
+            # Left and right thirds, the middle toggles pause
+            if event.pos[0] < self.display.left_third:
+                return -1
+            if event.pos[0] > self.display.right_third:
+                return 1
+        return 0
+    
     async def _handle_event(self, event):
         """Handle pygame events with error handling"""
         try:
@@ -457,59 +641,67 @@ class TeleFrame:
                 
             elif event.type == pygame.KEYDOWN:
                 await self._handle_keyboard(event.key)
+            
+            elif event.type == pygame.VIDEORESIZE and self.display:
+                self.display.set_screen_width(event.w)
+                self.display.needs_redraw = True
+            
+            elif event.type in _EXPOSE_EVENTS and self.display:
+                # Covered or restored window, the screen is not redrawn otherwise
+                self.display.needs_redraw = True
                 
         except Exception as e:
-            self.logger.error(f"Error handling event {event.type}: {e}")
+            self.logger.error("Error handling event %s: %s", event.type, e)
     
     async def _handle_touch(self, pos: tuple):
-        """Handle touch input with error handling"""
+        """Handle a tap in the middle third, left/right taps are navigation"""
         try:
-            if not self.display:
-                return
-                
-            screen_width = self.display.screen.get_width()
-            x, y = pos
-            
-            if x < screen_width // 3:
-                # Left third - previous image
-                await self.display.previous_image()
-            elif x > 2 * screen_width // 3:
-                # Right third - next image
-                await self.display.next_image()
-            else:
+            if self.display:
                 # Middle - pause/play
                 self.display.toggle_pause()
                 
         except Exception as e:
-            self.logger.error(f"Error handling touch: {e}")
+            self.logger.error("Error handling touch: %s", e)
     
     async def _handle_keyboard(self, key):
         """Handle keyboard input with monitor control"""
         try:
-            if key == pygame.K_ESCAPE or key == pygame.K_q:
-                self.shutdown_requested = True
-            elif key == pygame.K_LEFT and self.display:
-                await self.display.previous_image()
-            elif key == pygame.K_RIGHT and self.display:
-                await self.display.next_image()
-            elif key == pygame.K_SPACE and self.display:
-                self.display.toggle_pause()
-            
-            # NEW: Monitor control shortcuts (for debugging/testing)
-            elif key == pygame.K_m and self.monitor_controller:
-                # Toggle monitor (for testing)
-                if self.monitor_controller.monitor_state:
-                    await self.monitor_controller.turn_off(manual=True)
-                else:
-                    await self.monitor_controller.turn_on(manual=True)
-            
-            elif key == pygame.K_s and self.monitor_controller:
-                # Show monitor status in logs
-                status = self.monitor_controller.get_status()
-                self.logger.info(f"Monitor status: {status}")
+            handler = self._key_handlers.get(key)
+            if handler:
+                await handler()
                 
         except Exception as e:
-            self.logger.error(f"Error handling keyboard: {e}")
+            self.logger.error("Error handling keyboard: %s", e)
+    
+    async def _key_quit(self):
+        self.shutdown_requested = True
+    
+    async def _key_toggle_pause(self):
+        if self.display:
+            self.display.toggle_pause()
+    
+    async def _key_toggle_monitor(self):
+        """Toggle monitor (for testing)"""
+        if not self.monitor_controller:
+            return
+        if self.monitor_controller.monitor_state:
+            await self.monitor_controller.turn_off(manual=True)
+        else:
+            await self.monitor_controller.turn_on(manual=True)
+    
+    async def _key_monitor_status(self):
+        """Show monitor status in logs"""
+        if self.monitor_controller:
+            status = self.monitor_controller.get_status()
+            self.logger.info("Monitor status: %s", status)
+
+
+# (path, description) of the monitor control interfaces to report at startup
+_MONITOR_CONTROL_PATHS = (
+    ("/opt/vc/bin/vcgencmd", "vcgencmd (Raspberry Pi)"),
+    ("/sys/class/drm", "DRM/KMS"),
+    ("/sys/class/backlight", "Backlight"),
+)
 
 
 def check_prerequisites():
@@ -522,23 +714,17 @@ def check_prerequisites():
         return False
     
     # Check if config exists
-    if not Path("config.toml").exists():
+    if not os.path.exists("config.toml"):
         logger.error("❌ config.toml not found")
         logger.error("   Run: python setup.py")
         return False
     
     # Check if framebuffer exists (warning only)
-    if not Path("/dev/fb0").exists():
+    if not os.path.exists("/dev/fb0"):
         logger.warning("⚠️  /dev/fb0 not found - desktop mode only")
     
     # NEW: Check monitor control capabilities
-    monitor_methods = []
-    if Path("/opt/vc/bin/vcgencmd").exists():
-        monitor_methods.append("vcgencmd (Raspberry Pi)")
-    if Path("/sys/class/drm").exists():
-        monitor_methods.append("DRM/KMS")
-    if Path("/sys/class/backlight").exists():
-        monitor_methods.append("Backlight")
+    monitor_methods = [name for path, name in _MONITOR_CONTROL_PATHS if os.path.exists(path)]
     
     if monitor_methods:
         logger.info(f"🖥️  Monitor control available: {', '.join(monitor_methods)}")
@@ -547,7 +733,7 @@ def check_prerequisites():
     
     # Check required directories
     for directory in ["images", "logs"]:
-        Path(directory).mkdir(exist_ok=True)
+        os.makedirs(directory, exist_ok=True)
     
     return True
 
@@ -561,7 +747,10 @@ async def main():
     )
     
     logger = logging.getLogger("teleframe.main")
-    teleframe = None
+    
+    # Python 3.12+: tasks run inline until their first real suspension
+    if hasattr(asyncio, 'eager_task_factory'):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     
     try:
         # Check prerequisites
@@ -586,26 +775,17 @@ async def main():
         logger.error(f"💥 Fatal error: {e}")
         
     finally:
-        # Ensure cleanup happens even if there are errors
-        if teleframe:
-            try:
-                # Give cleanup extra time during shutdown
-                await asyncio.wait_for(teleframe._cleanup_with_timeout(), timeout=15.0)
-            except asyncio.TimeoutError:
-                logger.warning("⏰ Final cleanup timeout")
-            except Exception as e:
-                logger.error(f"Error during final cleanup: {e}")
-        
+        # start() cleans up on every exit path once it has taken the lock
         logger.info("👋 TeleFrame shutdown complete")
 
 
 if __name__ == "__main__":
     try:
-        # Suppress asyncio debug warnings during shutdown
-        import warnings
-        warnings.filterwarnings("ignore", category=RuntimeWarning, message=".*was destroyed but it is pending.*")
-        
-        asyncio.run(main())
+        if uvloop is not None:
+            # libuv based event loop, lower callback and timer overhead
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
         
     except KeyboardInterrupt:
         print("\n🛑 Shutdown requested by user")
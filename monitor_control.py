@@ -5,11 +5,42 @@ Compatible with Raspberry Pi, modern Linux, X11, and embedded systems
 """
 
 import asyncio
+import atexit
 import logging
+import os
+import shutil
 import subprocess
 from datetime import datetime, time, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+
+VCGENCMD_PATH = "/opt/vc/bin/vcgencmd"
+
+# Write payloads indexed by the target state: payload[turn_on]
+_DPMS_PAYLOAD = (b"Off", b"On")
+_ENABLE_PAYLOAD = (b"0", b"1")
+_BLANK_PAYLOAD = (b"1", b"0")  # 0=unblank, 1=blank
+
+# Blanking controls as (path, payload), in order of preference.
+# Cursor/active files take 1=active/0=inactive.
+_FBCON_CONTROLS = (
+    ("/sys/class/graphics/fbcon/cursor_blink", _ENABLE_PAYLOAD),
+    ("/sys/class/tty/tty0/active", _ENABLE_PAYLOAD),
+    ("/sys/module/kernel/parameters/consoleblank", _BLANK_PAYLOAD),
+    ("/sys/class/graphics/fb0/blank", _BLANK_PAYLOAD),
+)
+_DPMS_CONTROLS = (
+    ("/sys/class/graphics/fb0/blank", _BLANK_PAYLOAD),
+    ("/sys/class/drm/card0/card0-HDMI-A-1/dpms", _DPMS_PAYLOAD),
+    ("/sys/class/drm/card0/card0-VGA-1/dpms", _DPMS_PAYLOAD),
+    ("/sys/class/drm/card0/card0-DVI-D-1/dpms", _DPMS_PAYLOAD),
+)
+
+
+def _run_quick(argv: List[str]) -> subprocess.CompletedProcess:
+    """Run a short control command, meant for a worker thread"""
+    return subprocess.run(argv, capture_output=True, text=True,
+                          stdin=subprocess.DEVNULL, timeout=5)
 
 
 class MonitorController:
@@ -22,12 +53,39 @@ class MonitorController:
         # Use enhanced time objects from config
         self.turn_on_time = config.get_turn_on_time()
         self.turn_off_time = config.get_turn_off_time()
+        self._set_schedule_minutes()
         
         # Monitor state tracking
         self.monitor_state = True  # Assume monitor is on initially
         self.last_check = datetime.now()
         self.last_manual_override = None
         
+        # Scheduled state for the current interval and when it ends,
+        # so check_schedule only re-evaluates the schedule at the edges
+        self._update_transition(datetime.now())
+        
+        # path -> exists, filled once so detection and diagnostics
+        # don't stat the same sysfs entries again
+        self._probe_cache = self._probe_paths()
+        # (connector, path, payload) for connected DRM outputs, scanned on
+        # first use and dropped again when none of them can be written
+        self._drm_targets: Optional[List[Tuple[str, str, Tuple[bytes, bytes]]]] = None
+        
+        # sysfs control file kept open between toggles
+        self._ctrl_fd: Optional[int] = None
+        self._ctrl_path: Optional[str] = None
+        atexit.register(self.close)
+        
+        # Control commands by target state
+        self._vcgencmd_argv = {
+            True: ["sudo", VCGENCMD_PATH, "display_power", "1"],
+            False: ["sudo", VCGENCMD_PATH, "display_power", "0"],
+        }
+        self._xset_argv = {
+            True: ["xset", "dpms", "force", "on"],
+            False: ["xset", "dpms", "force", "off"],
+        }
+        
         # Auto-detect best control method
         self.control_method = self._detect_control_method()
         
@@ -37,19 +95,55 @@ class MonitorController:
         self.logger.info(f"   Schedule: ON at {config.format_time(self.turn_on_time)}, OFF at {config.format_time(self.turn_off_time)}")
         self.logger.info(f"   Auto-control: {'Enabled' if config.toggle_monitor else 'Disabled'}")
         
-        # Test control method on startup
-        self._test_control_method()
+        # Blanking controls for the fbcon/dpms methods; the one probed or last
+        # written successfully is tried first, the others stay as fallbacks
+        self._blank_candidates: Tuple[Tuple[str, Tuple[bytes, bytes]], ...] = ()
+        self._blank_control: Optional[Tuple[str, Tuple[bytes, bytes]]] = None
+        if self.control_method == "fbcon":
+            self._blank_candidates = _FBCON_CONTROLS
+        elif self.control_method == "dpms":
+            self._blank_candidates = _DPMS_CONTROLS
+        if self._blank_candidates:
+            self._blank_control = self._probe_blank_control(self._blank_candidates)
+        
+        # The control method is validated on its first real use instead of
+        # forking a test command during startup
+        self._control_verified = False
+        if self.control_method == "none":
+            self.logger.warning("⚠️  No monitor control available - commands will be ignored")
+    
+    def _probe_paths(self) -> Dict[str, bool]:
+        """Probe the control paths with one directory read of /sys/class"""
+        try:
+            with os.scandir("/sys/class") as entries:
+                classes = {entry.name for entry in entries}
+        except OSError:
+            classes = set()
+        
+        probes = {f"/sys/class/{name}": name in classes
+                  for name in ("drm", "backlight", "graphics")}
+        probes["/sys/class/graphics/fbcon"] = (
+            probes["/sys/class/graphics"] and os.path.exists("/sys/class/graphics/fbcon"))
+        probes[VCGENCMD_PATH] = os.path.exists(VCGENCMD_PATH)
+        return probes
+    
+    def _path_exists(self, path: str) -> bool:
+        """Cached existence check for control and diagnostic paths"""
+        exists = self._probe_cache.get(path)
+        if exists is None:
+            exists = self._probe_cache[path] = os.path.exists(path)
+        return exists
     
     def _detect_control_method(self) -> str:
         """Auto-detect the best available monitor control method"""
         
         # 1. Raspberry Pi vcgencmd (most reliable for Pi)
-        if Path("/opt/vc/bin/vcgencmd").exists():
+        if self._path_exists(VCGENCMD_PATH):
             self.logger.debug("Found vcgencmd - using Raspberry Pi control")
             return "vcgencmd"
         
         # 2. Modern DRM/KMS (Linux with modern graphics stack)
-        if Path("/sys/class/drm").exists():
+        if self._path_exists("/sys/class/drm"):
             drm_devices = list(Path("/sys/class/drm").glob("card*-*"))
             if drm_devices:
                 self.logger.debug(f"Found DRM devices: {len(drm_devices)}")
@@ -61,19 +155,19 @@ class MonitorController:
             return "xset"
         
         # 4. Backlight control (laptops, embedded displays)
-        if Path("/sys/class/backlight").exists():
+        if self._path_exists("/sys/class/backlight"):
             backlight_devices = list(Path("/sys/class/backlight").iterdir())
             if backlight_devices:
                 self.logger.debug(f"Found backlight devices: {len(backlight_devices)}")
                 return "backlight"
         
         # 5. Framebuffer console blanking
-        if Path("/sys/class/graphics/fbcon").exists():
+        if self._path_exists("/sys/class/graphics/fbcon"):
             self.logger.debug("Found fbcon - using framebuffer blanking")
             return "fbcon"
         
         # 6. Generic DPMS via sysfs
-        if Path("/sys/class/graphics").exists():
+        if self._path_exists("/sys/class/graphics"):
             self.logger.debug("Found graphics sysfs - using generic DPMS")
             return "dpms"
         
@@ -82,86 +176,26 @@ class MonitorController:
         return "none"
     
     def _command_exists(self, command: str) -> bool:
-        """Check if a command exists in PATH"""
-        try:
-            result = subprocess.run(
-                ["which", command], 
-                capture_output=True, 
-                text=True
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
-    
-    def _test_control_method(self):
-        """Test the selected control method to ensure it works"""
-        if self.control_method == "none":
-            self.logger.warning("⚠️  No monitor control available - commands will be ignored")
-            return
-        
-        try:
-            # Test basic functionality (synchronous test)
-            test_result = self._test_control_command_sync()
-            if test_result:
-                self.logger.info(f"✅ Monitor control test successful: {self.control_method}")
-            else:
-                self.logger.warning(f"⚠️  Monitor control test failed: {self.control_method}")
-        except Exception as e:
-            self.logger.error(f"❌ Monitor control test error: {e}")
-    
-    def _test_control_command_sync(self) -> bool:
-        """Test if the control method works (synchronous version)"""
-        try:
-            if self.control_method == "vcgencmd":
-                # Test vcgencmd without changing state
-                result = subprocess.run(
-                    ["/opt/vc/bin/vcgencmd", "display_power", "-1"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                return result.returncode == 0
-                
-            elif self.control_method == "xset":
-                # Test xset without changing state
-                result = subprocess.run(
-                    ["xset", "q"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                return result.returncode == 0
-                
-            elif self.control_method in ["drm", "backlight", "fbcon", "dpms"]:
-                # Test file system access
-                return self._test_sysfs_access()
-                
-        except Exception as e:
-            self.logger.debug(f"Control method test failed: {e}")
-            return False
-        
-        return True
+        """Check if a command exists in PATH (cached with the path probes)"""
+        key = f"which:{command}"
+        exists = self._probe_cache.get(key)
+        if exists is None:
+            exists = self._probe_cache[key] = shutil.which(command) is not None
+        return exists
     
     async def _test_control_command(self) -> bool:
         """Test if the control method works (without actually changing state)"""
         try:
+            loop = asyncio.get_running_loop()
             if self.control_method == "vcgencmd":
                 # Test vcgencmd without changing state
-                result = await asyncio.create_subprocess_exec(
-                    "/opt/vc/bin/vcgencmd", "display_power", "-1",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                stdout, stderr = await result.communicate()
+                result = await loop.run_in_executor(
+                    None, _run_quick, [VCGENCMD_PATH, "display_power", "-1"])
                 return result.returncode == 0
                 
             elif self.control_method == "xset":
                 # Test xset without changing state
-                result = await asyncio.create_subprocess_exec(
-                    "xset", "q",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
+                result = await loop.run_in_executor(None, _run_quick, ["xset", "q"])
                 return result.returncode == 0
                 
             elif self.control_method in ["drm", "backlight", "fbcon", "dpms"]:
@@ -184,10 +218,7 @@ class MonitorController:
         }
         
         paths = test_paths.get(self.control_method, [])
-        for path in paths:
-            if Path(path).exists():
-                return True
-        return False
+        return any(self._path_exists(path) for path in paths)
     
     async def check_schedule(self):
         """Check if monitor should be on/off based on schedule"""
@@ -200,8 +231,11 @@ class MonitorController:
             self.logger.debug("Skipping schedule check - manual override active")
             return
         
-        current_time = datetime.now().time()
-        should_be_on = self._should_monitor_be_on(current_time)
+        now = datetime.now()
+        if not self._transition_computed_at <= now < self._next_transition_at:
+            # Edge reached (or the clock was set back)
+            self._update_transition(now)
+        should_be_on = self._scheduled_state
         
         if should_be_on != self.monitor_state:
             self.logger.info(f"⏰ Schedule trigger: Monitor should be {'ON' if should_be_on else 'OFF'}")
@@ -211,14 +245,36 @@ class MonitorController:
             else:
                 await self.turn_off()
     
+    def _update_transition(self, now: datetime):
+        """Cache the scheduled state at `now` and the time it next changes"""
+        self._scheduled_state = self._should_monitor_be_on(now.time())
+        if self._scheduled_state:
+            # The OFF minute itself still counts as on
+            next_change = datetime.combine(now.date(), self.turn_off_time) + timedelta(minutes=1)
+        else:
+            next_change = datetime.combine(now.date(), self.turn_on_time)
+        
+        if next_change <= now:
+            next_change += timedelta(days=1)
+        
+        self._transition_computed_at = now
+        self._next_transition_at = next_change
+    
+    def _set_schedule_minutes(self):
+        """Precompute the schedule as minutes since midnight"""
+        self._on_minutes = self.turn_on_time.hour * 60 + self.turn_on_time.minute
+        self._off_minutes = self.turn_off_time.hour * 60 + self.turn_off_time.minute
+        self._schedule_wraps = self._on_minutes > self._off_minutes
+    
     def _should_monitor_be_on(self, current: time) -> bool:
         """Determine if monitor should be on based on current time"""
-        if self.turn_on_time <= self.turn_off_time:
+        minutes = current.hour * 60 + current.minute
+        if not self._schedule_wraps:
             # Same day schedule (e.g., 09:10 - 22:34)
-            return self.turn_on_time <= current <= self.turn_off_time
+            return self._on_minutes <= minutes <= self._off_minutes
         else:
             # Cross-midnight schedule (e.g., 22:34 - 09:10)
-            return current >= self.turn_on_time or current <= self.turn_off_time
+            return minutes >= self._on_minutes or minutes <= self._off_minutes
     
     async def turn_on(self, manual: bool = False):
         """Turn monitor on"""
@@ -278,6 +334,23 @@ class MonitorController:
             self.logger.debug("No control method - ignoring command")
             return False
         
+        success = await self._dispatch_control_command(turn_on)
+        if not self._control_verified:
+            await self._verify_control_method(success)
+        return success
+    
+    async def _verify_control_method(self, success: bool):
+        """Validate the control method once, on its first use"""
+        if success or await self._test_control_command():
+            self._control_verified = True
+            self.logger.info(f"✅ Monitor control test successful: {self.control_method}")
+        else:
+            self.logger.warning(f"⚠️  Monitor control test failed: {self.control_method} - "
+                                f"monitor control disabled")
+            self.control_method = "none"
+    
+    async def _dispatch_control_command(self, turn_on: bool) -> bool:
+        """Route a control command to the detected method"""
         try:
             # Route to appropriate control method
             if self.control_method == "vcgencmd":
@@ -302,70 +375,92 @@ class MonitorController:
     
     async def _control_vcgencmd(self, turn_on: bool) -> bool:
         """Control via Raspberry Pi vcgencmd"""
-        cmd = ["sudo", "/opt/vc/bin/vcgencmd", "display_power", "1" if turn_on else "0"]
-        
         try:
-            result = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await result.communicate()
+            result = await asyncio.get_running_loop().run_in_executor(
+                None, _run_quick, self._vcgencmd_argv[turn_on])
             
             if result.returncode == 0:
-                self.logger.debug(f"vcgencmd success: {stdout.decode().strip()}")
+                self.logger.debug(f"vcgencmd success: {result.stdout.strip()}")
                 return True
             else:
-                self.logger.error(f"vcgencmd failed: {stderr.decode().strip()}")
+                self.logger.error(f"vcgencmd failed: {result.stderr.strip()}")
                 return False
                 
         except Exception as e:
             self.logger.error(f"vcgencmd execution failed: {e}")
             return False
     
+    def _write_control(self, path: str, payload: bytes):
+        """Write a sysfs control value, keeping the file open for next time"""
+        if self._ctrl_path != path:
+            self.close()
+            self._ctrl_fd = os.open(path, os.O_WRONLY)
+            self._ctrl_path = path
+        
+        try:
+            os.pwrite(self._ctrl_fd, payload, 0)
+        except OSError:
+            self.close()
+            raise
+    
+    def close(self):
+        """Close the cached sysfs control file"""
+        if self._ctrl_fd is not None:
+            try:
+                os.close(self._ctrl_fd)
+            except OSError:
+                pass
+            self._ctrl_fd = None
+            self._ctrl_path = None
+    
+    def _scan_drm_targets(self) -> List[Tuple[str, str, Tuple[bytes, bytes]]]:
+        """Find the power control file of each connected DRM connector"""
+        with os.scandir("/sys/class/drm") as entries:
+            connectors = sorted(
+                (entry for entry in entries
+                 if entry.name.startswith("card") and "-" in entry.name and entry.is_dir()),
+                key=lambda entry: entry.name)
+        
+        targets = []
+        for connector in connectors:
+            try:
+                with open(os.path.join(connector.path, "status"), 'r') as f:
+                    if f.read().strip() != "connected":
+                        continue
+            except OSError:
+                continue
+            
+            # Prefer DPMS, fall back to the enabled switch
+            for control, payload in (("dpms", _DPMS_PAYLOAD), ("enabled", _ENABLE_PAYLOAD)):
+                control_path = os.path.join(connector.path, control)
+                if os.path.exists(control_path):
+                    targets.append((connector.name, control_path, payload))
+                    break
+        
+        self.logger.debug(f"DRM control targets: {[name for name, _, _ in targets]}")
+        return targets
+    
     async def _control_drm(self, turn_on: bool) -> bool:
         """Control via DRM/KMS connectors"""
         try:
-            drm_path = Path("/sys/class/drm")
+            if not self._drm_targets:
+                self._drm_targets = self._scan_drm_targets()
             
-            # Find connected displays
-            for connector in drm_path.glob("card*-*"):
-                if not connector.is_dir():
-                    continue
-                
-                status_file = connector / "status"
-                enabled_file = connector / "enabled"
-                dpms_file = connector / "dpms"
-                
+            for name, control_path, payload in self._drm_targets:
                 try:
-                    # Check if connector is connected
-                    if status_file.exists():
-                        with open(status_file, 'r') as f:
-                            status = f.read().strip()
-                        
-                        if status == "connected":
-                            # Try DPMS control first
-                            if dpms_file.exists():
-                                with open(dpms_file, 'w') as f:
-                                    f.write("On" if turn_on else "Off")
-                                self.logger.debug(f"DRM DPMS control: {connector.name}")
-                                return True
-                            
-                            # Try enabled control
-                            elif enabled_file.exists():
-                                with open(enabled_file, 'w') as f:
-                                    f.write("1" if turn_on else "0")
-                                self.logger.debug(f"DRM enabled control: {connector.name}")
-                                return True
-                                
+                    self._write_control(control_path, payload[turn_on])
+                    self.logger.debug(f"DRM {os.path.basename(control_path)} control: {name}")
+                    return True
+                    
                 except PermissionError:
-                    self.logger.debug(f"No permission for DRM control: {connector.name}")
+                    self.logger.debug(f"No permission for DRM control: {name}")
                     continue
                 except Exception as e:
-                    self.logger.debug(f"DRM control error for {connector.name}: {e}")
+                    self.logger.debug(f"DRM control error for {name}: {e}")
                     continue
             
+            # Rescan next time, a display may have been plugged in
+            self._drm_targets = None
             self.logger.warning("No accessible DRM connectors found")
             return False
             
@@ -375,25 +470,15 @@ class MonitorController:
     
     async def _control_xset(self, turn_on: bool) -> bool:
         """Control via X11 xset DPMS"""
-        if turn_on:
-            cmd = ["xset", "dpms", "force", "on"]
-        else:
-            cmd = ["xset", "dpms", "force", "off"]
-        
         try:
-            result = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await result.communicate()
+            result = await asyncio.get_running_loop().run_in_executor(
+                None, _run_quick, self._xset_argv[turn_on])
             
             if result.returncode == 0:
                 self.logger.debug(f"xset DPMS success")
                 return True
             else:
-                self.logger.error(f"xset DPMS failed: {stderr.decode().strip()}")
+                self.logger.error(f"xset DPMS failed: {result.stderr.strip()}")
                 return False
                 
         except Exception as e:
@@ -419,14 +504,12 @@ class MonitorController:
                             with open(max_brightness_file, 'r') as f:
                                 max_brightness = int(f.read().strip())
                             
-                            with open(brightness_file, 'w') as f:
-                                f.write(str(max_brightness))
+                            self._write_control(str(brightness_file), str(max_brightness).encode())
                                 
                             self.logger.debug(f"Backlight ON: {device.name} -> {max_brightness}")
                         else:
                             # Set to minimum brightness (0)
-                            with open(brightness_file, 'w') as f:
-                                f.write("0")
+                            self._write_control(str(brightness_file), b"0")
                                 
                             self.logger.debug(f"Backlight OFF: {device.name}")
                         
@@ -446,83 +529,54 @@ class MonitorController:
             self.logger.error(f"Backlight control error: {e}")
             return False
     
+    def _probe_blank_control(self, candidates) -> Optional[Tuple[str, Tuple[bytes, bytes]]]:
+        """Pick the first writable blanking control from candidates
+        
+        Only a preference: os.access() is True for root even on read-only
+        sysfs attributes, so _write_blank_control falls back on failure.
+        """
+        for control in candidates:
+            if os.access(control[0], os.W_OK):
+                self.logger.debug(f"Blanking control: {control[0]}")
+                return control
+        return None
+    
+    def _write_blank_control(self, turn_on: bool, label: str) -> bool:
+        """Write the preferred blanking control, then the remaining candidates"""
+        preferred = self._blank_control
+        candidates = ((preferred,) if preferred else ()) + tuple(
+            control for control in self._blank_candidates if control != preferred)
+        
+        for control in candidates:
+            path, payload = control
+            try:
+                self._write_control(path, payload[turn_on])
+            except FileNotFoundError:
+                continue
+            except PermissionError:
+                self.logger.debug(f"No permission for {label}: {path}")
+                continue
+            except Exception as e:
+                self.logger.debug(f"{label} control error for {path}: {e}")
+                continue
+            
+            if control != preferred:
+                # Remember the control that works for the next toggle
+                self._blank_control = control
+                self.logger.debug(f"Blanking control: {path}")
+            self.logger.debug(f"{label} control: {os.path.basename(path)}")
+            return True
+        
+        self.logger.warning(f"No accessible {label} controls found")
+        return False
+    
     async def _control_fbcon(self, turn_on: bool) -> bool:
         """Control via framebuffer console blanking"""
-        try:
-            # Various console blanking control files
-            blank_files = [
-                Path("/sys/class/graphics/fbcon/cursor_blink"),
-                Path("/sys/class/tty/tty0/active"),
-                Path("/sys/module/kernel/parameters/consoleblank"),
-                Path("/sys/class/graphics/fb0/blank")
-            ]
-            
-            for blank_file in blank_files:
-                if blank_file.exists():
-                    try:
-                        with open(blank_file, 'w') as f:
-                            if "blank" in str(blank_file) and "cursor" not in str(blank_file):
-                                # For actual blank files, 0=unblank, 1=blank
-                                f.write("0" if turn_on else "1")
-                            else:
-                                # For cursor/active files, 1=active, 0=inactive
-                                f.write("1" if turn_on else "0")
-                        
-                        self.logger.debug(f"FB console control: {blank_file.name}")
-                        return True
-                        
-                    except PermissionError:
-                        self.logger.debug(f"No permission for fbcon: {blank_file}")
-                        continue
-                    except Exception as e:
-                        self.logger.debug(f"FB console error for {blank_file}: {e}")
-                        continue
-            
-            self.logger.warning("No accessible framebuffer console controls found")
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"FB console control error: {e}")
-            return False
+        return self._write_blank_control(turn_on, "framebuffer console")
     
     async def _control_dpms(self, turn_on: bool) -> bool:
         """Control via generic DPMS"""
-        try:
-            # Various DPMS control files
-            dpms_files = [
-                Path("/sys/class/graphics/fb0/blank"),
-                Path("/sys/class/drm/card0/card0-HDMI-A-1/dpms"),
-                Path("/sys/class/drm/card0/card0-VGA-1/dpms"),
-                Path("/sys/class/drm/card0/card0-DVI-D-1/dpms")
-            ]
-            
-            for dpms_file in dpms_files:
-                if dpms_file.exists():
-                    try:
-                        with open(dpms_file, 'w') as f:
-                            if "blank" in str(dpms_file):
-                                # Blank files: 0=unblank, 1=blank
-                                f.write("0" if turn_on else "1")
-                            else:
-                                # DPMS files: On/Off
-                                f.write("On" if turn_on else "Off")
-                        
-                        self.logger.debug(f"DPMS control: {dpms_file.name}")
-                        return True
-                        
-                    except PermissionError:
-                        self.logger.debug(f"No permission for DPMS: {dpms_file}")
-                        continue
-                    except Exception as e:
-                        self.logger.debug(f"DPMS error for {dpms_file}: {e}")
-                        continue
-            
-            self.logger.warning("No accessible DPMS controls found")
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"DPMS control error: {e}")
-            return False
+        return self._write_blank_control(turn_on, "DPMS")
     
     def update_schedule(self, turn_on_time: str, turn_off_time: str) -> bool:
         """Update monitor schedule with new times"""
@@ -533,6 +587,8 @@ class MonitorController:
                 # Update local times
                 self.turn_on_time = self.config.get_turn_on_time()
                 self.turn_off_time = self.config.get_turn_off_time()
+                self._set_schedule_minutes()
+                self._update_transition(datetime.now())
                 
                 self.logger.info(f"📅 Schedule updated: ON at {self.config.format_time(self.turn_on_time)}, OFF at {self.config.format_time(self.turn_off_time)}")
                 
@@ -603,12 +659,12 @@ class MonitorController:
         
         # Check all available methods
         methods = [
-            ("vcgencmd", Path("/opt/vc/bin/vcgencmd").exists()),
-            ("drm", Path("/sys/class/drm").exists()),
+            ("vcgencmd", self._path_exists(VCGENCMD_PATH)),
+            ("drm", self._path_exists("/sys/class/drm")),
             ("xset", self._command_exists("xset")),
-            ("backlight", Path("/sys/class/backlight").exists()),
-            ("fbcon", Path("/sys/class/graphics/fbcon").exists()),
-            ("dpms", Path("/sys/class/graphics").exists())
+            ("backlight", self._path_exists("/sys/class/backlight")),
+            ("fbcon", self._path_exists("/sys/class/graphics/fbcon")),
+            ("dpms", self._path_exists("/sys/class/graphics"))
         ]
         
         for method, available in methods:
@@ -625,11 +681,11 @@ class MonitorController:
         
         # Hardware capabilities
         info["hardware"] = {
-            "raspberry_pi": Path("/opt/vc/bin/vcgencmd").exists(),
-            "framebuffer": Path("/dev/fb0").exists(),
-            "x11_display": bool(subprocess.run(["echo", "$DISPLAY"], capture_output=True).stdout.strip()),
-            "drm_devices": len(list(Path("/sys/class/drm").glob("card*"))) if Path("/sys/class/drm").exists() else 0,
-            "backlight_devices": len(list(Path("/sys/class/backlight").iterdir())) if Path("/sys/class/backlight").exists() else 0
+            "raspberry_pi": self._path_exists(VCGENCMD_PATH),
+            "framebuffer": self._path_exists("/dev/fb0"),
+            "x11_display": bool(os.environ.get("DISPLAY")),
+            "drm_devices": len(list(Path("/sys/class/drm").glob("card*"))) if self._path_exists("/sys/class/drm") else 0,
+            "backlight_devices": len(list(Path("/sys/class/backlight").iterdir())) if self._path_exists("/sys/class/backlight") else 0
         }
         
         return info
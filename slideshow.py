@@ -25,6 +25,9 @@ class SlideshowDisplay:
         
         # Display state
         self.screen = None
+        # Touch zone boundaries (previous | pause | next), see set_screen_width()
+        self.left_third = 0
+        self.right_third = 0
         self.current_image_index = 0
         self.is_paused = False
         self.current_surface = None
@@ -38,6 +41,8 @@ class SlideshowDisplay:
         self.fade_duration = config.fade_time
         self.fade_start_time = 0
         self.is_fading = False
+        # Set whenever update() has something new to draw
+        self.needs_redraw = False
         
         # Image sequence for different ordering modes
         self.image_sequence = []
@@ -264,6 +269,7 @@ class SlideshowDisplay:
                 self.font_large = self.font_medium = self.font_small = self.pygame.font.Font(None, 36)
             
             self.screen_size = self.screen.get_size()
+            self.set_screen_width(self.screen_size[0])
             
             # Final success message
             self.logger.info(f"🎉 Display initialized successfully!")
@@ -373,7 +379,8 @@ class SlideshowDisplay:
         self.sequence_index = 0
         self.last_order_mode = current_order_mode
         
-        self.logger.debug(f"Generated sequence: {len(self.image_sequence)} images, first 5: {self.image_sequence[:5]}")
+        self.logger.debug("Generated sequence: %d images, first 5: %s",
+                          len(self.image_sequence), self.image_sequence[:5])
     
     def _generate_random_sequence(self, image_count: int) -> List[int]:
         """Generate randomized image sequence"""
@@ -403,6 +410,8 @@ class SlideshowDisplay:
             
             # Show notification on screen if possible
             self._show_order_change_notification(new_order)
+            # Order indicator shows the new mode
+            self.needs_redraw = True
             return True
         else:
             self.logger.error(f"❌ Failed to change image order to: {new_order}")
@@ -535,41 +544,44 @@ class SlideshowDisplay:
     
     async def next_image(self):
         """Show next image based on current order mode"""
-        if not self.image_manager or self.image_manager.get_image_count() == 0:
-            self.logger.debug("No images available for next_image")
-            return
-        
-        # Update sequence if needed (e.g., new images added)
-        self._update_image_sequence()
-        
-        if not self.image_sequence:
-            return
-        
-        # Handle random mode special case - reshuffle when sequence ends
-        if (self.config.get_image_order_mode() == "random" and 
-            self.sequence_index >= len(self.image_sequence) - 1):
-            self.logger.debug("End of random sequence - reshuffling")
-            self._update_image_sequence(force_refresh=True)
-        
-        # Advance to next image
-        self.sequence_index = (self.sequence_index + 1) % len(self.image_sequence)
-        self.current_image_index = self.image_sequence[self.sequence_index]
-        
-        await self._transition_to_image(self.current_image_index)
+        await self.advance_by(1)
     
     async def previous_image(self):
         """Show previous image based on current order mode"""
+        await self.advance_by(-1)
+    
+    async def advance_by(self, steps: int):
+        """Move steps images forward (negative: back), showing only the last one
+        
+        Lets a burst of next/previous input cost one image load and flip.
+        """
+        if not steps:
+            return
+        
         if not self.image_manager or self.image_manager.get_image_count() == 0:
+            self.logger.debug("No images available to advance")
             return
         
-        # Update sequence if needed
+        # Update sequence if needed (e.g., new images added)
         self._update_image_sequence()
         
         if not self.image_sequence:
             return
         
-        # Go to previous image
-        self.sequence_index = (self.sequence_index - 1) % len(self.image_sequence)
+        if steps > 0:
+            random_mode = self.config.get_image_order_mode() == "random"
+            for _ in range(steps):
+                # Handle random mode special case - reshuffle when sequence ends
+                if random_mode and self.sequence_index >= len(self.image_sequence) - 1:
+                    self.logger.debug("End of random sequence - reshuffling")
+                    self._update_image_sequence(force_refresh=True)
+                
+                # Advance to next image
+                self.sequence_index = (self.sequence_index + 1) % len(self.image_sequence)
+        else:
+            # Go back, wrapping around the start
+            self.sequence_index = (self.sequence_index + steps) % len(self.image_sequence)
+        
         self.current_image_index = self.image_sequence[self.sequence_index]
         
         await self._transition_to_image(self.current_image_index)
@@ -581,7 +593,7 @@ class SlideshowDisplay:
             
         image_path = self.image_manager.get_image_path(image_index)
         if not image_path or not image_path.exists():
-            self.logger.warning(f"Image not found: {image_path}")
+            self.logger.warning("Image not found: %s", image_path)
             return
         
         # Load new image
@@ -611,11 +623,14 @@ class SlideshowDisplay:
 
         # Flip image if enabled
         self.pygame.display.flip()
+        # Redraw once with the indicators on the next update()
+        self.needs_redraw = True
         
         # Log with order info
-        order_mode = self.config.get_image_order_mode()
-        self.logger.debug(f"Showing image {image_index} ({self.sequence_index + 1}/{len(self.image_sequence)}) "
-                         f"[{order_mode}]: {image_path}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Showing image %d (%d/%d) [%s]: %s", image_index,
+                              self.sequence_index + 1, len(self.image_sequence),
+                              self.config.get_image_order_mode(), image_path)
     
     def _draw_image_info(self, image_index: int):
         """Draw image information overlay"""
@@ -665,18 +680,25 @@ class SlideshowDisplay:
         except Exception as e:
             self.logger.error(f"Error drawing image info: {e}")
     
+    def set_screen_width(self, width: int):
+        """Update touch zone boundaries for a new screen width"""
+        self.left_third = width // 3
+        self.right_third = 2 * width // 3
+    
     def toggle_pause(self):
         """Toggle pause state"""
         self.is_paused = not self.is_paused
-        self.logger.debug(f"Slideshow {'paused' if self.is_paused else 'resumed'}")
+        self.needs_redraw = True
+        self.logger.debug("Slideshow %s", "paused" if self.is_paused else "resumed")
     
     def update(self):
-        """Update display - call this in main loop"""
-        if not self.pygame or not self.screen:
+        """Update display - call this in main loop, redraws only after a change"""
+        if not self.pygame or not self.screen or not self.needs_redraw:
             return
             
         try:
             if not self.is_fading and self.current_surface:
+                self.needs_redraw = False
                 self.screen.blit(self.current_surface, (0, 0))
                 
                 # Show pause indicator
@@ -688,7 +710,7 @@ class SlideshowDisplay:
                 
                 self.pygame.display.flip()
         except Exception as e:
-            self.logger.error(f"Error updating display: {e}")
+            self.logger.error("Error updating display: %s", e)
     
     def _draw_pause_indicator(self):
         """Draw pause indicator on screen"""
@@ -710,7 +732,7 @@ class SlideshowDisplay:
             self.pygame.draw.rect(self.screen, self.white,
                             (x + bar_width + gap, y, bar_width, bar_height))
         except Exception as e:
-            self.logger.error(f"Error drawing pause indicator: {e}")
+            self.logger.error("Error drawing pause indicator: %s", e)
     
     def _draw_order_indicator(self):
         """Draw small order mode indicator in corner"""
@@ -737,7 +759,7 @@ class SlideshowDisplay:
             self.screen.blit(text_surface, (x, y))
             
         except Exception as e:
-            self.logger.error(f"Error drawing order indicator: {e}")
+            self.logger.error("Error drawing order indicator: %s", e)
     
     def get_current_order_info(self) -> dict:
         """Get information about current image order"""
@@ -755,7 +777,7 @@ class SlideshowDisplay:
             if self.image_manager:
                 was_unseen = self.image_manager.mark_image_seen(image_index)
                 if was_unseen:
-                    self.logger.debug(f"Image {image_index} marked as seen for first time")
+                    self.logger.debug("Image %d marked as seen for first time", image_index)
         except Exception as e:
             self.logger.error(f"Error marking image {image_index} as seen: {e}")
 
@@ -33,6 +33,10 @@ from telegram.error import (
 )
 
 
+class InvalidBotTokenError(ValueError):
+    """Bot token is missing, malformed or rejected by Telegram"""
+
+
 class UpdateRecoveryManager:
     """Manages persistent update tracking and recovery"""
     
@@ -175,16 +179,19 @@ class TeleFrameBot:
         """Initialize bot application with error handling"""
         try:
             if not self._validate_token(self.config.bot_token):
-                raise ValueError("Invalid bot token format")
+                raise InvalidBotTokenError("Invalid bot token format")
             
             # Application builder with enhanced configuration
             self.application = (Application.builder()
                               .token(self.config.bot_token)
                               .concurrent_updates(True)
                               .rate_limiter(None)
+                              # A few pooled keep-alive connections so
+                              # concurrent handlers don't queue on one socket
+                              .connection_pool_size(4)
                               .read_timeout(30)
                               .write_timeout(30)
-                              .connect_timeout(30)
+                              .connect_timeout(10)
                               .pool_timeout(30)
                               .build())
             
@@ -266,7 +273,9 @@ class TeleFrameBot:
         try:
             await self._test_bot_connection()
             await self.application.initialize()
-            await self.application.start()
+            # A retried start reuses the same application and its pool
+            if not self.application.running:
+                await self.application.start()
             
             # Perform update recovery before starting polling
             await self._perform_update_recovery()
@@ -275,7 +284,7 @@ class TeleFrameBot:
             
             self.running = True
             
-            bot_info = await self.bot.get_me()
+            bot_info = self.bot.bot
             self.logger.info(f"✅ Bot started successfully: @{bot_info.username}")
             
             # Update recovery stats
@@ -522,14 +531,19 @@ class TeleFrameBot:
             self.logger.debug(f"Unknown command in recovery: {command}")
     
     async def _test_bot_connection(self):
-        """Test bot connection and token validity"""
+        """Test bot connection and token validity.
+
+        Uses the application's own bot, so the connection opened here stays
+        in its pool for polling instead of being thrown away.
+        """
         try:
-            test_bot = Bot(token=self.config.bot_token)
-            bot_info = await test_bot.get_me()
+            # initialize() calls getMe and caches the result
+            await self.bot.initialize()
+            bot_info = self.bot.bot
             self.logger.info(f"🔍 Bot token valid: @{bot_info.username}")
             
         except Forbidden:
-            raise ValueError("❌ Invalid bot token - check config.toml")
+            raise InvalidBotTokenError("❌ Invalid bot token - check config.toml")
         except NetworkError as e:
             raise ConnectionError(f"❌ Network error: {e}")
         except Exception as e:
@@ -540,6 +554,10 @@ class TeleFrameBot:
         for attempt in range(max_retries):
             try:
                 await self.application.updater.start_polling(
+                    poll_interval=0.0,
+                    # Long polling: one open request instead of a new one
+                    # every few seconds while idle
+                    timeout=self.config.bot_polling_timeout,
                     drop_pending_updates=True  # We handle recovery manually
                 )
                 return
@@ -2086,7 +2104,7 @@ class TeleFrameBot:
             return
         
         # Add to image manager (optimization happens automatically)
-        success = self.image_manager.add_image(
+        success = await self.image_manager.add_image_async(
             file_path=file_path,
             sender=self._get_sender_name(update),
             caption=update.message.caption or "",
@@ -2152,7 +2170,7 @@ class TeleFrameBot:
             return
         
         # Add to image manager
-        success = self.image_manager.add_image(
+        success = await self.image_manager.add_image_async(
             file_path=file_path,
             sender=self._get_sender_name(update),
             caption=update.message.caption or "",
@@ -2213,7 +2231,7 @@ class TeleFrameBot:
             return
         
         # Add to image manager
-        success = self.image_manager.add_image(
+        success = await self.image_manager.add_image_async(
             file_path=file_path,
             sender=self._get_sender_name(update),
             caption=update.message.caption or document.file_name,